@@ -0,0 +1,73 @@
+"""
+Compare the compatibility macros and Arrow UDFs against row-by-row Python UDFs.
+
+    python benchmarks/bench_compat.py [rows]
+
+Each function is run over a generated column of ``rows`` values (default
+1,000,000) with the compat implementation registered for the executor's
+dialect, then with an equivalent Python UDF called once per row.
+"""
+
+import re
+import sys
+import time
+
+from duckdb_simulator import Dialect, DuckdbSQLExecutor, DuckdbSQLSeeder
+
+ROWS = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+
+
+def _isnumeric(value: str) -> int:
+    try:
+        float(value)
+    except (TypeError, ValueError):
+        return 0
+    return 1
+
+
+def _patindex(pattern: str, value: str) -> int:
+    match = re.search(re.escape(pattern.strip("%")), value)
+    return match.start() + 1 if match else 0
+
+
+CASES = [
+    (
+        "ISNUMERIC",
+        "SELECT SUM(ISNUMERIC(v)) FROM data",
+        "SELECT SUM(py_isnumeric(v)) FROM data",
+    ),
+    (
+        "PATINDEX",
+        "SELECT SUM(PATINDEX('%7%', v)) FROM data",
+        "SELECT SUM(py_patindex('%7%', v)) FROM data",
+    ),
+]
+
+
+def _timed(run) -> float:
+    started = time.perf_counter()
+    run()
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    seeder = DuckdbSQLSeeder()
+    conn = seeder.get_connection()
+    conn.execute(
+        f"CREATE TABLE data AS SELECT CASE WHEN range % 10 = 0 THEN 'x' || range "
+        f"ELSE CAST(range AS VARCHAR) END AS v FROM range({ROWS})"
+    )
+    conn.create_function("py_isnumeric", _isnumeric, ["VARCHAR"], "BIGINT")
+    conn.create_function("py_patindex", _patindex, ["VARCHAR", "VARCHAR"], "BIGINT")
+    executor = DuckdbSQLExecutor(dialect=Dialect.TSQL, seeder=seeder)
+
+    print(f"{ROWS:,} rows")
+    print(f"{'function':<12}{'compat':>10}{'python udf':>14}{'speedup':>10}")
+    for name, compat_query, udf_query in CASES:
+        compat = _timed(lambda: executor.query_to_df(compat_query))
+        udf = _timed(lambda: conn.execute(udf_query).fetchall())
+        print(f"{name:<12}{compat:>9.3f}s{udf:>13.3f}s{udf / compat:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
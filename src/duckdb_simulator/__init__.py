@@ -1,22 +1,63 @@
-from .models import Dialect
+from .models import Dialect, ExportResult, QueryStats
 from .seeder import DuckdbSQLSeeder
-from .executor import DuckdbSQLExecutor, QueryTranslationError, QueryExecutionError
+from .equivalence import EquivalenceCase, EquivalenceReport, run_equivalence
+from .executor import (
+    DuckdbSQLExecutor,
+    QueryCancelledError,
+    QueryExecutionError,
+    QueryInterruptedError,
+    QueryTimeoutError,
+    QueryTranslationError,
+)
+from .profiling import (
+    OperatorProfile,
+    QueryProfile,
+    QueryRecorder,
+    SlowQuery,
+    fingerprint,
+)
 from .protocols import SQLExecutor
+from .validation import ValidationResult
+from .warmup import WarmupReport, start_warmup
 from .testing import FixtureBuilder, assert_scalar, assert_shape, assert_value_types
 from . import fixtures
+from .registry import dataset_names, get_dataset, register_dataset
 
 __all__ = [
     # Core
     "Dialect",
+    "QueryStats",
+    "ExportResult",
     "DuckdbSQLSeeder",
     "DuckdbSQLExecutor",
     "SQLExecutor",
     "QueryTranslationError",
     "QueryExecutionError",
+    "QueryInterruptedError",
+    "QueryTimeoutError",
+    "QueryCancelledError",
+    # Cross-dialect equivalence
+    "EquivalenceCase",
+    "EquivalenceReport",
+    "run_equivalence",
+    # Profiling
+    "OperatorProfile",
+    "QueryProfile",
+    "SlowQuery",
+    "QueryRecorder",
+    "fingerprint",
+    # Static validation
+    "ValidationResult",
+    # Warm-up
+    "WarmupReport",
+    "start_warmup",
     # Testing toolkit
     "FixtureBuilder",
     "assert_scalar",
     "assert_shape",
     "assert_value_types",
     "fixtures",
+    "register_dataset",
+    "get_dataset",
+    "dataset_names",
 ]
@@ -0,0 +1,181 @@
+"""
+duckdb_simulator.compat
+-----------------------
+Source-dialect functions that sqlglot passes through to DuckDB unchanged, and
+that DuckDB does not have, implemented on the executor's connection.
+
+Most functions are temporary SQL macros, which DuckDB inlines into the plan so
+they run at column speed. Functions a macro cannot express are registered as
+vectorized Arrow UDFs: DuckDB hands them whole columns and they compute with
+``pyarrow.compute`` instead of calling Python once per row.
+
+Functions sqlglot rewrites itself from the version pinned in pyproject.toml
+(``DATEFROMPARTS``, ``EOMONTH``, ``IIF``, ``IFF``, ``DIV0``, ``TRY_TO_NUMBER``,
+...) are not redefined here; tests/test_compat.py runs each of them.
+
+Registration happens once per connection and dialect, so creating several
+executors on one seeder does not redefine the functions each time.
+"""
+
+from __future__ import annotations
+
+import re
+import weakref
+from collections.abc import Callable
+
+import duckdb
+import pyarrow as pa
+import pyarrow.compute as pc
+
+# Largest CHOOSE(index, value_1, ..., value_n) arity supported.
+_CHOOSE_MAX_VALUES = 16
+
+
+def _str_macro(length: str, decimals: str) -> str:
+    formatted = f"format('{{:.{{}}f}}', round(x::DOUBLE, {decimals}), {decimals})"
+    return (
+        f"CASE WHEN length({formatted}) > {length} THEN repeat('*', {length}) "
+        f"ELSE lpad({formatted}, {length}, ' ') END"
+    )
+
+
+def _choose_macro() -> str:
+    overloads = []
+    for n in range(1, _CHOOSE_MAX_VALUES + 1):
+        values = ", ".join(f"v{i}" for i in range(1, n + 1))
+        overloads.append(f"(i, {values}) AS [{values}][i]")
+    return "choose" + ", ".join(overloads)
+
+
+_TSQL_MACROS = (
+    "isnumeric(x) AS CASE WHEN TRY_CAST(x AS DOUBLE) IS NULL THEN 0 ELSE 1 END",
+    "isdate(x) AS CASE WHEN TRY_CAST(x AS TIMESTAMP) IS NULL THEN 0 ELSE 1 END",
+    f"str(x) AS {_str_macro('10', '0')}, "
+    f"(x, n) AS {_str_macro('n', '0')}, "
+    f"(x, n, d) AS {_str_macro('n', 'd')}",
+    "quotename(s) AS '[' || replace(s, ']', ']]') || ']', "
+    "(s, q) AS CASE WHEN q IN ('[', ']') THEN '[' || replace(s, ']', ']]') || ']' "
+    "ELSE q || replace(s, q, q || q) || q END",
+    # Bytes of a string; other types fail to bind rather than return a wrong size
+    "datalength(s) AS strlen(s)",
+    "smalldatetimefromparts(y, mo, d, h, mi) AS make_timestamp(y, mo, d, h, mi, 0)",
+    "datetime2fromparts(y, mo, d, h, mi, s, f, p) "
+    "AS make_timestamp(y, mo, d, h, mi, s + f / pow(10, p))",
+    _choose_macro(),
+)
+
+_SNOWFLAKE_MACROS = (
+    "try_base64_decode_string(s) AS TRY(decode(from_base64(s)))",
+    # Great-circle distance in km, with the earth radius Snowflake uses
+    "haversine(lat1, lon1, lat2, lon2) AS 2 * 6371 * asin(sqrt("
+    "pow(sin(radians(lat2 - lat1) / 2), 2) + "
+    "cos(radians(lat1)) * cos(radians(lat2)) * pow(sin(radians(lon2 - lon1) / 2), 2)))",
+)
+
+
+def _like_to_regex(pattern: str) -> str:
+    """Translate a T-SQL LIKE pattern (``%``, ``_``, ``[...]``) to an RE2 regex."""
+    parts = []
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        end = pattern.find("]", i + 1) if char == "[" else -1
+        if char == "%":
+            parts.append(".*")
+        elif char == "_":
+            parts.append(".")
+        elif end != -1:
+            parts.append("[" + pattern[i + 1 : end].replace("\\", "\\\\") + "]")
+            i = end
+        else:
+            parts.append(re.escape(char))
+        i += 1
+    return "".join(parts)
+
+
+def _patindex_regex(pattern: str) -> str:
+    # PATINDEX matches the whole value: a leading or trailing % un-anchors that end
+    anchored_start = not pattern.startswith("%")
+    anchored_end = not pattern.endswith("%")
+    regex = _like_to_regex(pattern.strip("%"))
+    return ("^" if anchored_start else "") + regex + ("$" if anchored_end else "")
+
+
+def _patindex(patterns: pa.ChunkedArray, values: pa.ChunkedArray) -> pa.Array:
+    """T-SQL PATINDEX: 1-based start of the first match of a LIKE pattern, or 0.
+
+    One regex scan of the whole column per distinct pattern, usually a literal.
+    """
+    distinct = pc.unique(patterns).to_pylist()
+    result = pa.nulls(len(values), pa.int64())
+    for pattern in distinct:
+        if pattern is None:
+            continue
+        found = pc.find_substring_regex(values, _patindex_regex(pattern))
+        positions = pc.add(pc.cast(found, pa.int64()), 1)
+        if len(distinct) == 1:
+            return positions
+        result = pc.if_else(pc.equal(patterns, pattern), positions, result)
+    return result
+
+
+# name -> (function, parameter types, return type)
+_TSQL_ARROW_FUNCTIONS: dict[str, tuple[Callable, list[str], str]] = {
+    "patindex": (_patindex, ["VARCHAR", "VARCHAR"], "BIGINT"),
+}
+
+_MACROS = {
+    "tsql": _TSQL_MACROS,
+    "snowflake": _SNOWFLAKE_MACROS,
+}
+_ARROW_FUNCTIONS = {
+    "tsql": _TSQL_ARROW_FUNCTIONS,
+}
+
+# connection -> dialect -> names of the functions registered on it
+_REGISTERED: weakref.WeakKeyDictionary[
+    duckdb.DuckDBPyConnection, dict[str, list[str]]
+] = weakref.WeakKeyDictionary()
+
+
+def _create_arrow_function(
+    conn: duckdb.DuckDBPyConnection,
+    name: str,
+    function: Callable,
+    parameters: list[str],
+    return_type: str,
+) -> None:
+    try:
+        conn.create_function(name, function, parameters, return_type, type="arrow")
+    except duckdb.NotImplementedException:
+        # Already registered on this database, e.g. by another executor
+        conn.remove_function(name)
+        conn.create_function(name, function, parameters, return_type, type="arrow")
+
+
+def register_compat(conn: duckdb.DuckDBPyConnection, read_dialect: str) -> list[str]:
+    """Register the compatibility functions of ``read_dialect`` on ``conn``.
+
+    Macros are temporary, so this also works on read-only databases. Repeated
+    calls for the same connection and dialect return without registering again.
+
+    Args:
+        conn:         Connection the translated queries run on.
+        read_dialect: sqlglot dialect of the source queries.
+
+    Returns:
+        list[str]: Names of the functions registered, empty for dialects without any.
+    """
+    dialect = getattr(read_dialect, "value", read_dialect)
+    registered = _REGISTERED.setdefault(conn, {})
+    if dialect in registered:
+        return list(registered[dialect])
+    names = []
+    for macro in _MACROS.get(dialect, ()):
+        conn.execute(f"CREATE OR REPLACE TEMP MACRO {macro}")
+        names.append(macro.split("(", 1)[0])
+    for name, spec in _ARROW_FUNCTIONS.get(dialect, {}).items():
+        _create_arrow_function(conn, name, *spec)
+        names.append(name)
+    registered[dialect] = names
+    return list(names)
@@ -0,0 +1,441 @@
+"""
+duckdb_simulator.daemon
+-----------------------
+A resident simulator process serving queries over a local Unix socket.
+
+Every test run, notebook kernel or script normally pays for imports, seeding
+and sqlglot warm-up again. The daemon keeps seeded databases, executors and
+their translations in memory; ``DaemonSQLExecutor`` sends it queries and gets
+the results back as Arrow IPC streams. Several processes share one copy of
+each seeded database.
+
+Start it with::
+
+    python -m duckdb_simulator.daemon --socket /tmp/duckdb-simulator.sock
+
+and query it from any process::
+
+    from duckdb_simulator.daemon import DaemonSQLExecutor
+
+    executor = DaemonSQLExecutor(Dialect.TSQL, "full")
+    df = executor.query_to_df("SELECT TOP 1 * FROM orders ORDER BY amount DESC")
+
+A source is a registered dataset name (``"full"``, ``"orders"``, ...), a
+DuckDB database file (opened read-only) or any path ``DuckdbSQLSeeder``
+accepts: a JSON manifest, a data file or a directory of them.
+
+Wire format: every request and response header is a 4-byte big-endian length
+followed by a JSON object. A successful query's header is followed by the
+result as an Arrow IPC stream, fetched from DuckDB without going through pandas.
+The client converts it with DuckDB too, so its DataFrame has the same dtypes as
+a local ``query_to_df``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import functools
+import json
+import os
+import socket
+import socketserver
+import struct
+import tempfile
+import threading
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any, BinaryIO
+
+import duckdb
+import pandas as pd
+import pyarrow as pa
+
+from . import registry
+from .executor import (
+    DuckdbSQLExecutor,
+    QueryCancelledError,
+    QueryExecutionError,
+    QueryInterruptedError,
+    QueryTimeoutError,
+    QueryTranslationError,
+)
+from .models import QueryStats
+from .seeder import DuckdbSQLSeeder
+
+_LENGTH = struct.Struct("!I")
+_DATABASE_EXTENSIONS = (".duckdb", ".db")
+# Errors re-raised by the client with the same type
+_ERRORS = {
+    error.__name__: error
+    for error in (
+        QueryTranslationError,
+        QueryExecutionError,
+        QueryTimeoutError,
+        QueryCancelledError,
+    )
+}
+
+
+class DaemonError(Exception):
+    """Raised when the daemon cannot be reached or cannot serve a request."""
+
+
+def default_socket_path() -> str:
+    """``$DUCKDB_SIMULATOR_SOCKET``, or a per-user socket in the temp directory."""
+    return os.environ.get("DUCKDB_SIMULATOR_SOCKET") or os.path.join(
+        tempfile.gettempdir(), f"duckdb-simulator-{os.getuid()}.sock"
+    )
+
+
+def _write_message(stream: BinaryIO, message: dict[str, Any]) -> None:
+    payload = json.dumps(message).encode()
+    stream.write(_LENGTH.pack(len(payload)) + payload)
+
+
+def _read_message(stream: BinaryIO) -> dict[str, Any] | None:
+    """Read one length-prefixed JSON message, or None if the peer closed the socket."""
+    header = stream.read(_LENGTH.size)
+    if not header:
+        return None
+    if len(header) < _LENGTH.size:
+        raise DaemonError("Connection closed in the middle of a message.")
+    (length,) = _LENGTH.unpack(header)
+    payload = stream.read(length)
+    if len(payload) < length:
+        raise DaemonError("Connection closed in the middle of a message.")
+    return json.loads(payload)
+
+
+# ---------------------------------------------------------------------------
+# Server
+# ---------------------------------------------------------------------------
+
+
+class _CachingExecutor(DuckdbSQLExecutor):
+    """Executor memoizing translations: a daemon sees the same queries over and over.
+
+    Only the side-effect-free sqlglot step is cached; per-call bookkeeping still runs.
+    """
+
+    def __init__(self, *args, cache_size: int, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._transpile = functools.lru_cache(maxsize=cache_size)(self._transpile)
+
+
+@dataclass
+class _Database:
+    """A seeded source and its executors, which share one connection."""
+
+    seeder: DuckdbSQLSeeder
+    executors: dict[str, DuckdbSQLExecutor] = field(default_factory=dict)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+def _open_seeder(source: str) -> DuckdbSQLSeeder:
+    if source in registry.dataset_names():
+        return DuckdbSQLSeeder.from_dataset(source)
+    if os.path.splitext(source)[1] in _DATABASE_EXTENSIONS:
+        return DuckdbSQLSeeder(database=source, read_only=True)
+    return DuckdbSQLSeeder(source)
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    # Buffer the Arrow stream's many small writes; flushed after each response
+    wbufsize = 1 << 16
+
+    def handle(self) -> None:
+        while True:
+            request = _read_message(self.rfile)
+            if request is None:
+                return
+            self.server.respond(request, self.wfile)
+            self.wfile.flush()
+
+
+class SimulatorDaemon(socketserver.ThreadingUnixStreamServer):
+    """Serves queries against resident seeded databases, one thread per client.
+
+    Queries on the same source are serialized, since its executors share a
+    DuckDB connection; different sources are served concurrently.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: str | None = None, *, cache_size: int = 1024):
+        """
+        Args:
+            socket_path: Unix socket to listen on. Defaults to ``default_socket_path()``.
+            cache_size:  Translations memoized per executor.
+
+        Raises:
+            DaemonError: If another daemon is already listening on ``socket_path``.
+        """
+        self.socket_path = socket_path or default_socket_path()
+        self.cache_size = cache_size
+        self._lock = threading.Lock()
+        self._databases: dict[str, _Database] = {}
+        self._remove_stale_socket()
+        super().__init__(self.socket_path, _Handler)
+
+    def _remove_stale_socket(self) -> None:
+        if not os.path.exists(self.socket_path):
+            return
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(self.socket_path)
+        except OSError:
+            os.unlink(self.socket_path)
+            return
+        finally:
+            probe.close()
+        raise DaemonError(f"A daemon is already listening on {self.socket_path}.")
+
+    def server_close(self) -> None:
+        super().server_close()
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+    def _database(self, source: str) -> _Database:
+        with self._lock:
+            database = self._databases.get(source)
+            if database is None:
+                database = _Database(_open_seeder(source))
+                # Export UUIDs and other DuckDB types as Arrow extension types, so the
+                # client's conversion gives the same DataFrame as a local query_to_df
+                database.seeder.conn.execute("SET arrow_lossless_conversion = true")
+                self._databases[source] = database
+            return database
+
+    def preload(self, source: str, dialect: str | None = None) -> None:
+        """Seed ``source`` and, if given, build its executor for ``dialect`` now."""
+        database = self._database(source)
+        if dialect is not None:
+            with database.lock:
+                self._executor(database, dialect)
+
+    def _executor(self, database: _Database, dialect: str) -> DuckdbSQLExecutor:
+        executor = database.executors.get(dialect)
+        if executor is None:
+            executor = _CachingExecutor(
+                dialect, database.seeder, cache_size=self.cache_size
+            )
+            database.executors[dialect] = executor
+        return executor
+
+    def _query(self, request: dict[str, Any]) -> tuple[dict[str, Any], pa.Table]:
+        database = self._database(request["source"])
+        with database.lock:
+            executor = self._executor(database, request["dialect"])
+            table = executor.query_to_arrow(
+                request["query"],
+                pre_queries=request.get("pre_queries"),
+                post_queries=request.get("post_queries"),
+                timeout=request.get("timeout"),
+            )
+            stats = dataclasses.asdict(executor.last_stats)
+        return {"ok": True, "stats": stats}, table
+
+    def respond(self, request: dict[str, Any], stream: BinaryIO) -> None:
+        """Answer one request: a header, followed by an Arrow stream for query results."""
+        table = None
+        try:
+            op = request.get("op")
+            if op == "query":
+                header, table = self._query(request)
+            elif op == "ping":
+                with self._lock:
+                    header = {"ok": True, "sources": sorted(self._databases)}
+            else:
+                raise DaemonError(f"Unknown operation '{op}'.")
+        except Exception as e:
+            header = {"ok": False, "error": type(e).__name__, "message": str(e)}
+            if isinstance(e, (QueryInterruptedError, QueryExecutionError)):
+                header["details"] = {
+                    "query": e.query,
+                    "translated_query": e.translated_query,
+                    "translate_seconds": e.translate_seconds,
+                    "execute_seconds": e.execute_seconds,
+                }
+                if isinstance(e, QueryTimeoutError):
+                    header["details"]["timeout"] = e.timeout
+        _write_message(stream, header)
+        if table is not None:
+            with pa.ipc.new_stream(stream, table.schema) as writer:
+                writer.write_table(table)
+
+
+def serve(
+    socket_path: str | None = None,
+    *,
+    preload: Iterable[tuple[str, str | None]] = (),
+    cache_size: int = 1024,
+) -> None:
+    """Run a daemon in the foreground until interrupted.
+
+    Args:
+        socket_path: Unix socket to listen on. Defaults to ``default_socket_path()``.
+        preload:     (source, dialect) pairs to seed before accepting connections.
+        cache_size:  Translations memoized per executor.
+    """
+    with SimulatorDaemon(socket_path, cache_size=cache_size) as server:
+        for source, dialect in preload:
+            server.preload(source, dialect)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+# ---------------------------------------------------------------------------
+# Client
+# ---------------------------------------------------------------------------
+
+
+class DaemonSQLExecutor:
+    """
+    Executor forwarding queries to a running ``SimulatorDaemon``.
+    Compliant with the SQLExecutor protocol.
+    """
+
+    def __init__(
+        self,
+        dialect: str,
+        source: str,
+        *,
+        socket_path: str | None = None,
+        timeout: float | None = None,
+    ):
+        """
+        Args:
+            dialect (str): The dialect of the input queries (e.g. "azure-synapse-t-sql").
+            source (str): Registered dataset name, DuckDB database file, or a path
+                          accepted by DuckdbSQLSeeder. Local paths are made absolute.
+            socket_path (str | None): Daemon socket. Defaults to ``default_socket_path()``.
+            timeout (float | None): Default execution timeout of each query, in seconds.
+
+        Raises:
+            DaemonError: If no daemon is listening on the socket.
+        """
+        self.dialect = getattr(dialect, "value", dialect)
+        self.source = os.path.abspath(source) if os.path.exists(source) else source
+        self.socket_path = socket_path or default_socket_path()
+        self.timeout = timeout
+        self.last_stats: QueryStats | None = None
+        self._lock = threading.Lock()
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            self._socket.connect(self.socket_path)
+        except OSError as e:
+            self._socket.close()
+            raise DaemonError(
+                f"No duckdb-simulator daemon on {self.socket_path}: {e}"
+            ) from e
+        self._rfile = self._socket.makefile("rb")
+        self._wfile = self._socket.makefile("wb")
+        # Converts received Arrow tables the way a local query_to_df would
+        self._converter = duckdb.connect()
+
+    def _request(
+        self, message: dict[str, Any]
+    ) -> tuple[dict[str, Any], pa.Table | None]:
+        with self._lock:
+            _write_message(self._wfile, message)
+            self._wfile.flush()
+            header = _read_message(self._rfile)
+            if header is None:
+                raise DaemonError("The daemon closed the connection.")
+            table = None
+            if header["ok"] and message["op"] == "query":
+                table = pa.ipc.open_stream(self._rfile).read_all()
+        if not header["ok"]:
+            error = _ERRORS.get(header["error"])
+            if error is None:
+                raise DaemonError(f"{header['error']}: {header['message']}")
+            raise error(header["message"], **header.get("details", {}))
+        return header, table
+
+    def ping(self) -> list[str]:
+        """Return the sources the daemon has seeded so far."""
+        return self._request({"op": "ping"})[0]["sources"]
+
+    def query_to_df(
+        self,
+        query: str,
+        pre_queries: list[str] | None = None,
+        post_queries: list[str] | None = None,
+        *,
+        timeout: float | None = None,
+    ) -> pd.DataFrame:
+        """
+        Runs the query in the daemon and returns its result as a pandas DataFrame.
+        Timing of the call, as measured by the daemon, is stored in ``last_stats``.
+
+        Raises:
+            QueryTranslationError: If query translation fails.
+            QueryExecutionError: If query execution fails.
+            QueryTimeoutError: If execution exceeds the timeout and is interrupted.
+            DaemonError: If the daemon cannot serve the request, e.g. an unknown source.
+        """
+        header, table = self._request(
+            {
+                "op": "query",
+                "source": self.source,
+                "dialect": self.dialect,
+                "query": query,
+                "pre_queries": pre_queries,
+                "post_queries": post_queries,
+                "timeout": self.timeout if timeout is None else timeout,
+            }
+        )
+        self.last_stats = QueryStats(**header["stats"])
+        with self._lock:
+            return self._converter.from_arrow(table).df()
+
+    def close(self) -> None:
+        """Close the connection to the daemon; the daemon keeps running."""
+        self._rfile.close()
+        self._wfile.close()
+        self._socket.close()
+        self._converter.close()
+
+    def __enter__(self) -> DaemonSQLExecutor:
+        return self
+
+    def __exit__(self, *_exc_info) -> None:
+        self.close()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m duckdb_simulator.daemon",
+        description="Serve seeded DuckDB databases to DaemonSQLExecutor clients.",
+    )
+    parser.add_argument(
+        "--socket",
+        default=None,
+        help="Unix socket path (default: $DUCKDB_SIMULATOR_SOCKET or a per-user temp path).",
+    )
+    parser.add_argument(
+        "--preload",
+        action="append",
+        default=[],
+        metavar="SOURCE[:DIALECT]",
+        help="Seed a source, and build its executor for DIALECT, at startup. Repeatable.",
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=1024,
+        help="Translations memoized per executor (default 1024).",
+    )
+    args = parser.parse_args(argv)
+    preload = []
+    for entry in args.preload:
+        source, separator, dialect = entry.rpartition(":")
+        preload.append((source, dialect) if separator else (entry, None))
+    serve(args.socket, preload=preload, cache_size=args.cache_size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,287 @@
+"""
+duckdb_simulator.equivalence
+----------------------------
+Checks that versions of the same query written for different dialects return
+identical results. Translate-and-execute work is spread over a process pool;
+every worker opens the same saved database read-only.
+
+Workers are spawned, so they import the ``__main__`` module again: a script
+must only call run_equivalence under an ``if __name__ == "__main__":`` guard.
+
+Example::
+
+    if __name__ == "__main__":
+        seeder = DuckdbSQLSeeder(fixtures.FULL)
+        seeder.save("full.duckdb")
+
+        report = run_equivalence(
+            [
+                EquivalenceCase(
+                    "top_order",
+                    {
+                        Dialect.TSQL: "SELECT TOP 1 id FROM orders ORDER BY amount DESC",
+                        Dialect.SNOWFLAKE: "SELECT id FROM orders ORDER BY amount DESC LIMIT 1",
+                    },
+                ),
+            ],
+            database="full.duckdb",
+        )
+        assert not report.mismatches, report.summary()
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import time
+from collections.abc import Iterable, Mapping
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+
+import pandas as pd
+
+from .executor import DuckdbSQLExecutor, QueryExecutionError, QueryTranslationError
+from .models import Dialect
+from .seeder import DuckdbSQLSeeder
+
+# ---------------------------------------------------------------------------
+# Cases and results
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class EquivalenceCase:
+    """One logical query, with a version per dialect.
+
+    The first dialect in ``queries`` is the baseline the others are compared to.
+    Unless ``ordered`` is True, row order is ignored.
+    """
+
+    name: str
+    queries: Mapping[str, str]
+    ordered: bool = False
+
+
+@dataclass(frozen=True)
+class DialectRun:
+    """Outcome of translating and executing one dialect's version of a case."""
+
+    dialect: str
+    translated_query: str | None
+    translate_seconds: float
+    execute_seconds: float
+    frame: pd.DataFrame | None = field(default=None, repr=False)
+    error: str | None = None
+
+
+@dataclass(frozen=True)
+class CaseResult:
+    """All dialect runs of a case, and the dialects that disagree with the baseline."""
+
+    name: str
+    runs: dict[str, DialectRun]
+    mismatches: dict[str, str]
+
+    @property
+    def equivalent(self) -> bool:
+        return not self.mismatches
+
+
+@dataclass(frozen=True)
+class EquivalenceReport:
+    """Results of run_equivalence, in case order."""
+
+    cases: list[CaseResult]
+
+    @property
+    def mismatches(self) -> list[CaseResult]:
+        """Cases where at least one dialect failed or disagreed with the baseline."""
+        return [case for case in self.cases if not case.equivalent]
+
+    def translation_cost(self) -> dict[str, float]:
+        """Total sqlglot translation time per dialect, in seconds."""
+        cost: dict[str, float] = {}
+        for case in self.cases:
+            for dialect, run in case.runs.items():
+                cost[dialect] = cost.get(dialect, 0.0) + run.translate_seconds
+        return cost
+
+    def summary(self) -> str:
+        """Human-readable summary of mismatches and translation cost."""
+        lines = [
+            f"{len(self.cases) - len(self.mismatches)}/{len(self.cases)} cases equivalent"
+        ]
+        for case in self.mismatches:
+            for dialect, reason in case.mismatches.items():
+                lines.append(f"  {case.name} [{dialect}]: {reason}")
+        lines.append("Translation cost per dialect:")
+        for dialect, seconds in sorted(self.translation_cost().items()):
+            lines.append(f"  {dialect}: {seconds * 1000:.1f} ms")
+        return "\n".join(lines)
+
+
+# ---------------------------------------------------------------------------
+# Worker side — one read-only seeder per process, one executor per dialect
+# ---------------------------------------------------------------------------
+
+_worker_seeder: DuckdbSQLSeeder | None = None
+_worker_executors: dict[str, DuckdbSQLExecutor] = {}
+
+
+def _init_worker(database: str, threads: int | None) -> None:
+    global _worker_seeder
+    _worker_seeder = DuckdbSQLSeeder(database=database, read_only=True, threads=threads)
+    _worker_executors.clear()
+
+
+def _run_query(dialect: str, query: str) -> DialectRun:
+    executor = _worker_executors.get(dialect)
+    if executor is None:
+        executor = DuckdbSQLExecutor(dialect=dialect, seeder=_worker_seeder)
+        _worker_executors[dialect] = executor
+
+    started = time.perf_counter()
+    try:
+        frame = executor.query_to_df(query)
+    except QueryTranslationError as e:
+        return DialectRun(
+            dialect=dialect,
+            translated_query=None,
+            translate_seconds=time.perf_counter() - started,
+            execute_seconds=0.0,
+            error=f"{type(e).__name__}: {e}",
+        )
+    except QueryExecutionError as e:
+        return DialectRun(
+            dialect=dialect,
+            translated_query=e.translated_query,
+            translate_seconds=e.translate_seconds,
+            execute_seconds=e.execute_seconds,
+            error=f"{type(e).__name__}: {e}",
+        )
+    stats = executor.last_stats
+    return DialectRun(
+        dialect=dialect,
+        translated_query=stats.translated_query,
+        translate_seconds=stats.translate_seconds,
+        execute_seconds=stats.execute_seconds,
+        frame=frame,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Comparison
+# ---------------------------------------------------------------------------
+
+
+def _canonical(frame: pd.DataFrame, ordered: bool) -> pd.DataFrame:
+    """Drop column names and, unless ordered, sort rows so frames compare by value."""
+    frame = frame.reset_index(drop=True)
+    frame.columns = range(frame.shape[1])
+    if not ordered and frame.shape[1]:
+        columns = list(frame.columns)
+        try:
+            frame = frame.sort_values(columns, kind="mergesort")
+        except TypeError:
+            frame = frame.sort_values(
+                columns, kind="mergesort", key=lambda column: column.astype(str)
+            )
+        frame = frame.reset_index(drop=True)
+    return frame
+
+
+def _compare(baseline: pd.DataFrame, other: pd.DataFrame, ordered: bool) -> str | None:
+    """Return a description of the difference between two results, or None."""
+    if baseline.shape != other.shape:
+        return f"shape {other.shape} != baseline shape {baseline.shape}"
+    try:
+        pd.testing.assert_frame_equal(
+            _canonical(baseline, ordered),
+            _canonical(other, ordered),
+            check_dtype=False,
+            check_column_type=False,
+        )
+    except AssertionError as e:
+        return str(e).strip().splitlines()[0]
+    return None
+
+
+def _case_result(case: EquivalenceCase, runs: dict[str, DialectRun]) -> CaseResult:
+    mismatches = {
+        dialect: run.error for dialect, run in runs.items() if run.error is not None
+    }
+    baseline_dialect = next(iter(runs))
+    baseline = runs[baseline_dialect]
+    if baseline.error is None:
+        for dialect, run in runs.items():
+            if dialect == baseline_dialect or run.error is not None:
+                continue
+            difference = _compare(baseline.frame, run.frame, case.ordered)
+            if difference is not None:
+                mismatches[dialect] = difference
+    return CaseResult(name=case.name, runs=runs, mismatches=mismatches)
+
+
+# ---------------------------------------------------------------------------
+# Runner
+# ---------------------------------------------------------------------------
+
+
+def _dialect_name(dialect: str) -> str:
+    """Plain dialect string for a Dialect member or a raw sqlglot dialect name."""
+    return dialect.value if isinstance(dialect, Dialect) else dialect
+
+
+def run_equivalence(
+    cases: Iterable[EquivalenceCase],
+    database: str | os.PathLike,
+    *,
+    max_workers: int | None = None,
+    threads_per_worker: int | None = 1,
+) -> EquivalenceReport:
+    """Translate and execute every dialect version of every case in a process pool.
+
+    Args:
+        cases:              Queries to compare, each with one version per dialect.
+        database:           DuckDB file written by ``DuckdbSQLSeeder.save()``.
+        max_workers:        Number of worker processes. Defaults to the CPU count.
+        threads_per_worker: DuckDB threads per worker, so workers do not
+                            oversubscribe the cores. None uses DuckDB's default.
+
+    Returns:
+        EquivalenceReport: Per-case results, mismatches and translation cost.
+
+    Raises:
+        ValueError: If the database file does not exist or a case has no queries.
+    """
+    database = os.fspath(database)
+    if not os.path.isfile(database):
+        raise ValueError(f"Database file '{database}' does not exist.")
+    cases = list(cases)
+    for case in cases:
+        if not case.queries:
+            raise ValueError(f"Case '{case.name}' has no queries.")
+
+    # DuckDB runs its own threads, so workers are spawned rather than forked
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(database, threads_per_worker),
+    ) as pool:
+        futures = [
+            {
+                _dialect_name(dialect): pool.submit(
+                    _run_query, _dialect_name(dialect), query
+                )
+                for dialect, query in case.queries.items()
+            }
+            for case in cases
+        ]
+        results = [
+            _case_result(
+                case, {dialect: future.result() for dialect, future in runs.items()}
+            )
+            for case, runs in zip(cases, futures)
+        ]
+    return EquivalenceReport(cases=results)
@@ -1,9 +1,32 @@
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable
+from operator import methodcaller
+from typing import Any
+
 import duckdb
 import pandas as pd
+import pyarrow as pa
 import sqlglot
+from sqlglot import exp
+from sqlglot.schema import MappingSchema
+
+from .compat import register_compat
+from .models import Dialect, ExportResult, QueryStats
+from .profiling import QueryProfile, SlowQuery, parse_profile
+from .seeder import DuckdbSQLSeeder, _quote
+from .validation import (
+    ValidationResult,
+    build_schema,
+    validate_queries,
+    validate_query,
+)
+from .warmup import Warmup, start_warmup
 
-from .models import Dialect
-from .seeder import DuckdbSQLSeeder
+logger = logging.getLogger(__name__)
 
 
 class QueryTranslationError(Exception):
@@ -11,7 +34,121 @@ class QueryTranslationError(Exception):
 
 
 class QueryExecutionError(Exception):
-    """Raised when SQL query execution fails."""
+    """
+    Raised when SQL query execution fails. Raised by query_to_df or query_to_file,
+    it carries the translated query and the timings measured up to the failure.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        *,
+        query: str | None = None,
+        translated_query: str | None = None,
+        translate_seconds: float | None = None,
+        execute_seconds: float | None = None,
+    ):
+        super().__init__(message)
+        self.query = query
+        self.translated_query = translated_query
+        self.translate_seconds = translate_seconds
+        self.execute_seconds = execute_seconds
+
+
+class QueryInterruptedError(Exception):
+    """
+    Raised when a running query is interrupted before it completes.
+    Carries the timings measured up to the interruption.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        *,
+        query: str,
+        translated_query: str,
+        translate_seconds: float,
+        execute_seconds: float,
+    ):
+        super().__init__(message)
+        self.query = query
+        self.translated_query = translated_query
+        self.translate_seconds = translate_seconds
+        self.execute_seconds = execute_seconds
+
+
+class QueryTimeoutError(QueryInterruptedError):
+    """Raised when a query runs longer than its timeout and is interrupted."""
+
+    def __init__(self, message: str, *, timeout: float, **timings):
+        super().__init__(message, **timings)
+        self.timeout = timeout
+
+
+class QueryCancelledError(QueryInterruptedError):
+    """Raised when a running query is stopped with ``DuckdbSQLExecutor.cancel()``."""
+
+
+# Metrics collected by DuckDB's profiler for every executed query, once profiling is
+# needed. "no_output" mode keeps the profile in memory instead of printing it.
+_PROFILING_METRICS = {
+    "EXTRA_INFO": "true",
+    "LATENCY": "true",
+    "OPERATOR_CARDINALITY": "true",
+    "OPERATOR_NAME": "true",
+    "OPERATOR_TIMING": "true",
+}
+# Added to the metrics when memory is tracked
+_MEMORY_METRICS = {
+    "SYSTEM_PEAK_BUFFER_MEMORY": "true",
+    "SYSTEM_PEAK_TEMP_DIR_SIZE": "true",
+}
+
+# DuckDB reports buffer memory and temp-directory peaks over the database's
+# lifetime, not per query. While a query runs, duckdb_memory() is polled from a
+# side cursor at this interval and the highest reading is kept instead.
+_MEMORY_POLL_SECONDS = 0.01
+_MEMORY_QUERY = (
+    "SELECT sum(memory_usage_bytes), sum(temporary_storage_bytes) FROM duckdb_memory()"
+)
+_PEAK_MEMORY = "system_peak_buffer_memory"
+_PEAK_TEMP = "system_peak_temp_dir_size"
+
+
+class _MemorySampler:
+    """Polls duckdb_memory() in a background thread, keeping the highest readings."""
+
+    def __init__(self, conn: duckdb.DuckDBPyConnection):
+        self._conn = conn
+        self._stopped = threading.Event()
+        self.memory_bytes = 0
+        self.temp_bytes = 0
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            try:
+                memory, temp = self._conn.execute(_MEMORY_QUERY).fetchone()
+            except duckdb.Error:
+                return
+            self.memory_bytes = max(self.memory_bytes, int(memory or 0))
+            self.temp_bytes = max(self.temp_bytes, int(temp or 0))
+            if self._stopped.wait(_MEMORY_POLL_SECONDS):
+                return
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._thread.join()
+
+
+# Formats accepted by query_to_file, written with DuckDB's COPY ... TO.
+_EXPORT_FORMATS = ("parquet", "csv")
+
+
+def _changes_schema(expression: exp.Expression) -> bool:
+    """Whether a statement creates, drops or alters an object."""
+    return expression.find(exp.Create, exp.Drop, exp.Alter) is not None
 
 
 class DuckdbSQLExecutor:
@@ -21,29 +158,382 @@ class DuckdbSQLExecutor:
     Compliant with the SQLExecutor protocol.
     """
 
-    def __init__(self, dialect: str, seeder: DuckdbSQLSeeder):
+    def __init__(
+        self,
+        dialect: str,
+        seeder: DuckdbSQLSeeder,
+        *,
+        slow_query_threshold: float | None = None,
+        sample_rate: float | None = None,
+        sample_seed: int = 42,
+        warmup: bool = False,
+        timeout: float | None = None,
+        compat: bool = True,
+        track_memory: bool = False,
+    ):
         """
         Initializes the executor with a specific dialect and a seeded DB connection.
 
         Args:
             dialect (str): The dialect of the input queries (e.g. "azure-synapse-t-sql").
             seeder (DuckdbSQLSeeder): An initialized seeder with populated tables.
+            slow_query_threshold (float | None): Seconds above which a query_to_df call is
+                                                 recorded in ``slow_queries`` with its plan.
+            sample_rate (float | None): Run queries against a deterministic sample of each seeded
+                                        table holding this fraction of its rows, e.g. 0.1.
+                                        Results are labelled with the rate in ``df.attrs``.
+            sample_seed (int): Seed of the sample, so repeated runs see the same rows.
+            warmup (bool): Pre-load the read dialect and run a trivial query in a background
+                           thread, so the first real query does not pay for it. Cold and warm
+                           latencies are returned by ``warmup.wait()``.
+            timeout (float | None): Seconds a query_to_df call may spend executing before it is
+                                    interrupted with QueryTimeoutError. Overridable per call.
+            compat (bool): Register macros and vectorized UDFs for source-dialect functions that
+                           sqlglot passes through but DuckDB lacks, e.g. T-SQL PATINDEX.
+            track_memory (bool): Record the peak buffer memory and temp-directory size of
+                                 each query in ``last_stats``, polling DuckDB while it runs.
+                                 Off by default, as it adds latency to every query.
         """
+        self._check_timeout(timeout)
+        if sample_rate is not None and not 0 < sample_rate <= 1:
+            raise ValueError(f"sample_rate must be in (0, 1], got {sample_rate}.")
         try:
             self.dialect_enum = Dialect(dialect)
             self.read_dialect = self.dialect_enum.to_sqlglot_dialect(dialect)
         except ValueError:
             self.read_dialect = dialect
 
+        self.seeder = seeder
         self.conn = seeder.get_connection()
+        self._schema: MappingSchema | None = None
+        self._schema_catalog: dict | None = None
+        self.last_stats: QueryStats | None = None
+        # Called with the QueryStats of every successful query_to_df call
+        self.listeners: list[Callable[[QueryStats], None]] = []
+        self.slow_query_threshold = slow_query_threshold
+        self.slow_queries: list[SlowQuery] = []
+        self.sample_rate = sample_rate
+        self.sample_seed = sample_seed
+        # Set by each translation: time spent building samples, and for each statement
+        # the seeded tables it reads through a sample and the ones it writes to
+        self._sample_build_seconds = 0.0
+        self._statement_tables: list[tuple[set[str], set[str]]] = []
+        # Set by each translation when a statement creates, drops or alters an object
+        self._schema_changed = False
+        self.timeout = timeout
+        # Guards the running flag and interrupt reason shared with watchdogs and cancel()
+        self._interrupt_lock = threading.Lock()
+        self._running = False
+        self._interrupt_reason: str | None = None
+        self.track_memory = track_memory
+        self._profiling = False
+        self._enable_profiling()
+        # Names of the source-dialect functions registered on the connection
+        self.compat_functions: list[str] = (
+            register_compat(self.conn, self.read_dialect) if compat else []
+        )
+        self.warmup: Warmup | None = (
+            start_warmup(self.read_dialect, self.conn) if warmup else None
+        )
+
+    def _enable_profiling(self) -> None:
+        """
+        Turns on in-memory DuckDB profiling once memory tracking or the slow-query log
+        needs it. Both can be switched on after construction, so this runs per query.
+        """
+        if self._profiling or not (
+            self.track_memory or self.slow_query_threshold is not None
+        ):
+            return
+        metrics = {
+            **_PROFILING_METRICS,
+            **(_MEMORY_METRICS if self.track_memory else {}),
+        }
+        self.conn.execute("PRAGMA enable_profiling = 'no_output'")
+        self.conn.execute(f"SET custom_profiling_settings = '{json.dumps(metrics)}'")
+        self._profiling = True
+        if self.track_memory:
+            # Side cursor polling memory usage while this executor's queries run
+            self._memory_conn = self.conn.cursor()
+            # Database-lifetime peaks seen so far, to tell whether a query raised them
+            self.conn.execute("SELECT 1").fetchall()
+            baseline = self._read_profile()
+            self._high_water = (
+                baseline.get(_PEAK_MEMORY, 0),
+                baseline.get(_PEAK_TEMP, 0),
+            )
+
+    def _start_sampler(self) -> _MemorySampler | None:
+        """Starts polling memory for the next query, if memory is tracked."""
+        self._enable_profiling()
+        return _MemorySampler(self._memory_conn) if self.track_memory else None
+
+    def _query_profile(self, sampler: _MemorySampler | None) -> dict:
+        """Returns the profile of the last query with its own peaks, or an empty dict
+        when profiling is off."""
+        if not self._profiling:
+            return {}
+        return self._per_query_peaks(self._read_profile(), sampler)
+
+    def _per_query_peaks(self, profile: dict, sampler: _MemorySampler | None) -> dict:
+        """
+        Replaces DuckDB's database-lifetime peaks in the profile with the query's own.
+        A lifetime peak raised during the query is exact; otherwise the sampled
+        maximum is used. Without a sampler, memory is not tracked and both are removed.
+        """
+        if sampler is None:
+            profile.pop(_PEAK_MEMORY, None)
+            profile.pop(_PEAK_TEMP, None)
+            return profile
+        sampler.stop()
+        if not profile:
+            return profile
+        memory_mark, temp_mark = self._high_water
+        memory, temp = profile.get(_PEAK_MEMORY), profile.get(_PEAK_TEMP)
+        if memory is not None:
+            profile[_PEAK_MEMORY] = (
+                memory if memory > memory_mark else sampler.memory_bytes
+            )
+            memory_mark = max(memory_mark, memory)
+        if temp is not None:
+            profile[_PEAK_TEMP] = temp if temp > temp_mark else sampler.temp_bytes
+            temp_mark = max(temp_mark, temp)
+        self._high_water = (memory_mark, temp_mark)
+        return profile
+
+    def _read_profile(self) -> dict:
+        """Returns the profile of the last executed query, or an empty dict."""
+        try:
+            return json.loads(self.conn.get_profiling_information(format="json"))
+        except (duckdb.Error, ValueError):
+            return {}
+
+    def _translate(self, query: str) -> str:
+        """
+        Translates a query from the source dialect to DuckDB SQL.
+
+        Raises:
+            QueryTranslationError: If query translation fails.
+        """
+        self._sample_build_seconds = 0.0
+        self._statement_tables = []
+        try:
+            return self._generate(query)[0]
+        except Exception as e:
+            raise QueryTranslationError(
+                f"Failed to parse and translate query: {e}"
+            ) from e
+
+    def _transpile(self, sql: str) -> tuple[tuple[str, bool], ...]:
+        """
+        Translates each statement of ``sql`` to DuckDB SQL, paired with whether it
+        changes the schema. Free of side effects, so it can be memoized.
+        """
+        return tuple(
+            (
+                ("", False)
+                if expression is None
+                else (expression.sql(dialect="duckdb"), _changes_schema(expression))
+            )
+            for expression in sqlglot.parse(sql, read=self.read_dialect)
+        )
+
+    def _generate(self, sql: str) -> list[str]:
+        """
+        Translates the statements of ``sql``, noting whether any changes the schema
+        and, in sampled mode, pointing their reads at samples.
+        """
+        if self.sample_rate is None:
+            statements = self._transpile(sql)
+        else:
+            statements = [
+                (
+                    ("", False)
+                    if expression is None
+                    else (
+                        self._sampled(expression).sql(dialect="duckdb"),
+                        _changes_schema(expression),
+                    )
+                )
+                for expression in sqlglot.parse(sql, read=self.read_dialect)
+            ]
+        self._schema_changed = any(changes for _, changes in statements)
+        return [translated for translated, _ in statements]
+
+    def _refresh_catalog(self) -> None:
+        """Drops the seeder's cached catalog after statements that changed the schema."""
+        if self._schema_changed:
+            self.seeder._catalog = None
+
+    def _sampled(self, expression: exp.Expression) -> exp.Expression:
+        """
+        Points every seeded-table reference read by the statement at the seeder's
+        sample of that table. Tables written to or created and dropped keep their
+        name, so DML and DDL change the real table. Their samples are rebuilt before
+        a later statement of the same call reads them, and dropped once it has run.
+        """
+        tables = {name.lower(): name for name in self.seeder.catalog()}
+        ctes = {cte.alias_or_name.lower() for cte in expression.find_all(exp.CTE)}
+        targets = set()
+        reads: set[str] = set()
+        writes: set[str] = set()
+        self._statement_tables.append((reads, writes))
+        for statement in expression.find_all(
+            exp.Insert, exp.Update, exp.Delete, exp.Merge, exp.Create, exp.Drop
+        ):
+            target = statement.this
+            if isinstance(target, exp.Schema):
+                target = target.this
+            if isinstance(target, exp.Table):
+                targets.add(id(target))
+                if target.name.lower() in tables and target.db.lower() in ("", "main"):
+                    writes.add(tables[target.name.lower()])
+
+        def _replace(node: exp.Expression) -> exp.Expression:
+            if not isinstance(node, exp.Table) or node.catalog or id(node) in targets:
+                return node
+            name = node.name.lower()
+            if (
+                node.db.lower() not in ("", "main")
+                or name in ctes
+                or name not in tables
+            ):
+                return node
+            reads.add(tables[name])
+            build_started = time.perf_counter()
+            sample = self.seeder.sample_table(
+                tables[name], self.sample_rate, self.sample_seed
+            )
+            self._sample_build_seconds += time.perf_counter() - build_started
+            replacement = exp.to_table(sample)
+            # Keep the original name as alias so qualified column references still resolve
+            replacement.set(
+                "alias",
+                node.args.get("alias")
+                or exp.TableAlias(this=exp.to_identifier(node.name)),
+            )
+            return replacement
+
+        # In place, so the nodes collected in targets are the ones visited
+        return expression.transform(_replace, copy=False)
+
+    def _resample_stale(self, statement: int) -> float:
+        """
+        Rebuilds the samples that statement ``statement`` of the last translated batch
+        reads from tables the statements before it write to, so it sees their changes.
+
+        Returns:
+            float: Seconds spent rebuilding, also added to the sample build time.
+        """
+        reads = self._statement_tables[statement][0]
+        written = set().union(
+            *(writes for _, writes in self._statement_tables[:statement])
+        )
+        started = time.perf_counter()
+        for table in sorted(reads & written):
+            self.seeder._drop_samples(table)
+            self.seeder.sample_table(table, self.sample_rate, self.sample_seed)
+        elapsed = time.perf_counter() - started
+        self._sample_build_seconds += elapsed
+        return elapsed
+
+    def _translate_batch(self, statements: list[str]) -> list[str]:
+        """
+        Translates several single-statement queries in one sqlglot pass.
+
+        Raises:
+            QueryTranslationError: If translation fails or a query holds several statements.
+        """
+        script = ";\n".join(statement.strip().rstrip(";") for statement in statements)
+        self._sample_build_seconds = 0.0
+        self._statement_tables = []
+        try:
+            translated = self._generate(script)
+        except Exception as e:
+            raise QueryTranslationError(
+                f"Failed to parse and translate query: {e}"
+            ) from e
+        if len(translated) != len(statements):
+            raise QueryTranslationError(
+                "Each of query, pre_queries and post_queries must hold exactly one "
+                f"statement: got {len(translated)} statements for {len(statements)} queries."
+            )
+        return translated
 
-    def query_to_df(self, query: str) -> pd.DataFrame:
+    @staticmethod
+    def _check_timeout(timeout: float | None) -> None:
+        if timeout is not None and timeout <= 0:
+            raise ValueError(f"timeout must be positive, got {timeout}.")
+
+    def _interrupt(self, reason: str) -> bool:
+        """Interrupts the running query, once, recording why. Safe to call from any thread."""
+        with self._interrupt_lock:
+            if not self._running or self._interrupt_reason is not None:
+                return False
+            self._interrupt_reason = reason
+            self.conn.interrupt()
+            return True
+
+    def _start_watch(self, timeout: float | None) -> threading.Timer | None:
+        """Marks a query as running and arms a watchdog interrupting it after ``timeout``."""
+        with self._interrupt_lock:
+            self._running = True
+            self._interrupt_reason = None
+        if timeout is None:
+            return None
+        watchdog = threading.Timer(timeout, self._interrupt, args=("timeout",))
+        watchdog.daemon = True
+        watchdog.start()
+        return watchdog
+
+    def _end_watch(self, watchdog: threading.Timer | None) -> str | None:
+        """Disarms the watchdog and returns why the query was interrupted, if it was."""
+        if watchdog is not None:
+            watchdog.cancel()
+        with self._interrupt_lock:
+            self._running = False
+            return self._interrupt_reason
+
+    def cancel(self) -> bool:
+        """
+        Interrupts the query currently running in query_to_df, which then raises
+        QueryCancelledError. Meant to be called from another thread.
+
+        Returns:
+            bool: True if a running query was interrupted.
+        """
+        return self._interrupt("cancelled")
+
+    def _rollback(self) -> None:
+        """Rolls back the open transaction, if any, after a failed batch."""
+        try:
+            self.conn.execute("ROLLBACK")
+        except duckdb.Error:
+            pass
+
+    def query_to_df(
+        self,
+        query: str,
+        pre_queries: list[str] | None = None,
+        post_queries: list[str] | None = None,
+        *,
+        timeout: float | None = None,
+    ) -> pd.DataFrame:
         """
         Translates the given query from the source dialect to duckdb dialect,
         executes it, and returns a pandas DataFrame.
+        Timing and peak memory of the call are stored in ``last_stats``.
+
+        As with Dataiku's SQLExecutor2, pre_queries run before the query and
+        post_queries after it. All statements are translated in one pass and run
+        in a single transaction, which is rolled back if any of them fails.
 
         Args:
             query (str): SQL query to execute
+            pre_queries (list[str] | None): Statements to run first, e.g. settings or temp tables
+            post_queries (list[str] | None): Statements to run after the query, e.g. cleanup
+            timeout (float | None): Seconds the statements may spend executing, overriding
+                                    the executor's ``timeout``. Translation is not counted.
 
         Returns:
             pd.DataFrame: Result of SQL query
@@ -51,24 +541,370 @@ class DuckdbSQLExecutor:
         Raises:
             QueryTranslationError: If query translation fails.
             QueryExecutionError: If query execution fails.
+            QueryTimeoutError: If execution exceeds the timeout and is interrupted.
+            QueryCancelledError: If ``cancel()`` interrupts the query.
+        """
+        df, stats = self._run(
+            query, pre_queries, post_queries, timeout, methodcaller("fetchdf")
+        )
+        if self.sample_rate is not None:
+            df.attrs["sample_rate"] = self.sample_rate
+            df.attrs["estimated_full_seconds"] = stats.estimated_full_seconds
+        return df
+
+    def query_to_arrow(
+        self,
+        query: str,
+        pre_queries: list[str] | None = None,
+        post_queries: list[str] | None = None,
+        *,
+        timeout: float | None = None,
+    ) -> pa.Table:
+        """
+        Same as query_to_df, but returns the result as an Arrow table fetched straight
+        from DuckDB, without building a DataFrame.
+
+        Raises:
+            QueryTranslationError: If query translation fails.
+            QueryExecutionError: If query execution fails.
+            QueryTimeoutError: If execution exceeds the timeout and is interrupted.
+            QueryCancelledError: If ``cancel()`` interrupts the query.
         """
+        return self._run(
+            query, pre_queries, post_queries, timeout, methodcaller("to_arrow_table")
+        )[0]
+
+    def _run(
+        self,
+        query: str,
+        pre_queries: list[str] | None,
+        post_queries: list[str] | None,
+        timeout: float | None,
+        fetch: Callable[[duckdb.DuckDBPyConnection], Any],
+    ) -> tuple[Any, QueryStats]:
+        """Translates and runs a query with its pre- and post-queries, and returns
+        the result read by ``fetch`` with the stats of the call."""
+        self._check_timeout(timeout)
+        timeout = self.timeout if timeout is None else timeout
+        pre_queries = list(pre_queries or [])
+        post_queries = list(post_queries or [])
+        batch = bool(pre_queries or post_queries)
+
+        started = time.perf_counter()
+        if batch:
+            translated_all = self._translate_batch([*pre_queries, query, *post_queries])
+            pre_sql = translated_all[: len(pre_queries)]
+            translated_query = translated_all[len(pre_queries)]
+            post_sql = translated_all[len(pre_queries) + 1 :]
+        else:
+            translated_query = self._translate(query)
+        translated = time.perf_counter()
+        translate_seconds = translated - started - self._sample_build_seconds
+
+        watchdog = self._start_watch(timeout)
+        sampler = self._start_sampler()
         try:
-            translated_query = sqlglot.transpile(
-                query, read=self.read_dialect, write="duckdb"
-            )[0]
+            if batch and self.sample_rate is not None:
+                self.conn.execute(";\n".join(["BEGIN TRANSACTION", *pre_sql]))
+                # Sample rebuilds count as sample build time, not execution time
+                translated += self._resample_stale(len(pre_sql))
+                result = self.conn.execute(translated_query)
+            elif batch:
+                # One round trip up to the main query, whose result DuckDB returns
+                result = self.conn.execute(
+                    ";\n".join(["BEGIN TRANSACTION", *pre_sql, translated_query])
+                )
+            else:
+                result = self.conn.execute(translated_query)
+            if result is None:
+                raise QueryExecutionError("Query returned no result object.")
+            fetched = fetch(result)
+            profile = self._query_profile(sampler)
+            if batch:
+                self.conn.execute(";\n".join([*post_sql, "COMMIT"]))
         except Exception as e:
-            raise QueryTranslationError(
-                f"Failed to parse and translate query: {e}"
+            if sampler is not None:
+                sampler.stop()
+            reason = self._end_watch(watchdog)
+            if batch:
+                self._rollback()
+            self._refresh_catalog()
+            raise self._execution_error(
+                e,
+                reason,
+                timeout,
+                query=query,
+                translated_query=translated_query,
+                translate_seconds=translate_seconds,
+                execute_seconds=time.perf_counter() - translated,
+            ) from e
+        self._end_watch(watchdog)
+        self._refresh_catalog()
+        for _, writes in self._statement_tables:
+            for table in writes:
+                self.seeder._drop_samples(table)
+
+        stats = self._record_stats(
+            query,
+            translated_query,
+            translate_seconds,
+            translated,
+            len(fetched),
+            profile,
+        )
+        return fetched, stats
+
+    def _record_stats(
+        self,
+        query: str,
+        translated_query: str,
+        translate_seconds: float,
+        translated: float,
+        rows: int,
+        profile: dict,
+    ) -> QueryStats:
+        """Stores the stats of a finished call in ``last_stats``, notifies listeners
+        and logs the call if it was slow."""
+        finished = time.perf_counter()
+        self.last_stats = QueryStats(
+            query=query,
+            translated_query=translated_query,
+            translate_seconds=translate_seconds,
+            execute_seconds=finished - translated,
+            sample_build_seconds=self._sample_build_seconds,
+            rows=rows,
+            peak_memory_bytes=profile.get(_PEAK_MEMORY),
+            peak_temp_bytes=profile.get(_PEAK_TEMP),
+            sample_rate=self.sample_rate,
+        )
+        for listener in self.listeners:
+            listener(self.last_stats)
+        if (
+            self.slow_query_threshold is not None
+            and self.last_stats.total_seconds > self.slow_query_threshold
+        ):
+            self._log_slow_query(profile)
+        return self.last_stats
+
+    def query_to_file(
+        self,
+        query: str,
+        path: str,
+        format: str = "parquet",
+        *,
+        compression: str | None = None,
+        row_group_size: int | None = None,
+        partition_by: list[str] | None = None,
+        timeout: float | None = None,
+    ) -> ExportResult:
+        """
+        Translates the given query and streams its result straight to a Parquet or CSV
+        file with DuckDB's COPY ... TO, without building a DataFrame. Memory use does not
+        grow with the size of the result.
+
+        Args:
+            query (str): SQL query to export
+            path (str): Target file, or target directory when partition_by is given
+            format (str): "parquet" or "csv"
+            compression (str | None): Codec, e.g. "zstd", "snappy" (parquet) or "gzip" (csv)
+            row_group_size (int | None): Rows per Parquet row group
+            partition_by (list[str] | None): Columns to write a Hive-partitioned directory by
+            timeout (float | None): Seconds the export may run, overriding the executor's ``timeout``
+
+        Returns:
+            ExportResult: Rows exported, files written and their total size in bytes.
+
+        Raises:
+            ValueError: If the format or options are not supported.
+            QueryTranslationError: If query translation fails.
+            QueryExecutionError: If the export fails.
+            QueryTimeoutError: If the export exceeds the timeout and is interrupted.
+            QueryCancelledError: If ``cancel()`` interrupts the export.
+        """
+        format = format.lower()
+        if format not in _EXPORT_FORMATS:
+            raise ValueError(
+                f"Unsupported export format '{format}'. Expected one of {_EXPORT_FORMATS}."
+            )
+        if row_group_size is not None and format != "parquet":
+            raise ValueError("row_group_size only applies to the parquet format.")
+        self._check_timeout(timeout)
+        timeout = self.timeout if timeout is None else timeout
+
+        options = [f"FORMAT {format}"]
+        if compression is not None:
+            options.append(f"COMPRESSION {_quote(compression)}")
+        if row_group_size is not None:
+            options.append(f"ROW_GROUP_SIZE {int(row_group_size)}")
+        if partition_by:
+            columns = ", ".join(
+                '"' + column.replace('"', '""') + '"' for column in partition_by
+            )
+            options.append(f"PARTITION_BY ({columns})")
+
+        started = time.perf_counter()
+        translated_query = self._translate(query)
+        translated = time.perf_counter()
+        translate_seconds = translated - started - self._sample_build_seconds
+
+        watchdog = self._start_watch(timeout)
+        sampler = self._start_sampler()
+        try:
+            rows = self.conn.execute(
+                f"COPY ({translated_query}) TO {_quote(path)} ({', '.join(options)})"
+            ).fetchone()[0]
+            profile = self._query_profile(sampler)
+        except Exception as e:
+            if sampler is not None:
+                sampler.stop()
+            raise self._execution_error(
+                e,
+                self._end_watch(watchdog),
+                timeout,
+                query=query,
+                translated_query=translated_query,
+                translate_seconds=translate_seconds,
+                execute_seconds=time.perf_counter() - translated,
             ) from e
+        self._end_watch(watchdog)
+
+        stats = self._record_stats(
+            query, translated_query, translate_seconds, translated, rows, profile
+        )
+        if os.path.isdir(path):
+            files = tuple(
+                sorted(
+                    os.path.join(root, name)
+                    for root, _, names in os.walk(path)
+                    for name in names
+                )
+            )
+        else:
+            files = (path,)
+        return ExportResult(
+            path=path,
+            format=format,
+            rows=rows,
+            bytes_written=sum(os.path.getsize(file) for file in files),
+            files=files,
+            stats=stats,
+        )
+
+    @staticmethod
+    def _execution_error(
+        error: Exception, reason: str | None, timeout: float | None, **timings
+    ) -> Exception:
+        """Maps an exception raised while executing to the error query_to_df raises."""
+        if reason is None:
+            if isinstance(error, duckdb.Error):
+                return QueryExecutionError(
+                    f"Database execution failed: {error}", **timings
+                )
+            return QueryExecutionError(
+                f"An unexpected error occurred during execution: {error}", **timings
+            )
+        elapsed = timings["execute_seconds"]
+        if reason == "timeout":
+            return QueryTimeoutError(
+                f"Query exceeded its {timeout}s timeout and was interrupted "
+                f"after {elapsed:.3f}s.",
+                timeout=timeout,
+                **timings,
+            )
+        return QueryCancelledError(
+            f"Query was cancelled after {elapsed:.3f}s.", **timings
+        )
 
+    def _log_slow_query(self, profile: dict) -> None:
+        """Appends the last query and its plan to the slow-query log."""
+        stats = self.last_stats
+        entry = SlowQuery(
+            query=stats.query,
+            translated_query=stats.translated_query,
+            elapsed_seconds=stats.total_seconds,
+            profile=parse_profile(
+                profile, query=stats.query, translated_query=stats.translated_query
+            ),
+        )
+        self.slow_queries.append(entry)
+        logger.warning(
+            "Slow query (%.3fs > %.3fs):\n%s\n-- translated --\n%s\n-- plan --\n%s",
+            entry.elapsed_seconds,
+            self.slow_query_threshold,
+            entry.query,
+            entry.translated_query,
+            entry.profile.render(),
+        )
+
+    def profile(self, query: str) -> QueryProfile:
+        """
+        Translates and runs the query under EXPLAIN ANALYZE, without fetching its rows.
+
+        Args:
+            query (str): SQL query to profile
+
+        Returns:
+            QueryProfile: Operator tree with per-operator timing and cardinality.
+
+        Raises:
+            QueryTranslationError: If query translation fails.
+            QueryExecutionError: If query execution fails.
+        """
+        translated_query = self._translate(query)
+        sampler = self._start_sampler()
         try:
-            result = self.conn.execute(translated_query)
-            if result is None:
-                raise QueryExecutionError("Query returned no result object.")
-            return result.fetchdf()
+            row = self.conn.execute(
+                f"EXPLAIN (ANALYZE, FORMAT JSON) {translated_query}"
+            ).fetchone()
         except duckdb.Error as e:
+            if sampler is not None:
+                sampler.stop()
             raise QueryExecutionError(f"Database execution failed: {e}") from e
-        except Exception as e:
-            raise QueryExecutionError(
-                f"An unexpected error occurred during execution: {e}"
-            ) from e
+        return parse_profile(
+            self._per_query_peaks(json.loads(row[1]), sampler),
+            query=query,
+            translated_query=translated_query,
+        )
+
+    def _validation_schema(self) -> MappingSchema:
+        """Returns the sqlglot schema of the seeded catalog, rebuilt only when it changes."""
+        catalog = self.seeder.catalog()
+        if catalog is not self._schema_catalog:
+            self._schema = build_schema(catalog)
+            self._schema_catalog = catalog
+        return self._schema
+
+    def validate(self, query: str) -> ValidationResult:
+        """
+        Checks a query against the seeded schema without executing it.
+
+        Args:
+            query (str): SQL query to validate
+
+        Returns:
+            ValidationResult: Translated query and any translation, table, column
+                              or type problems found.
+        """
+        return validate_query(query, self.read_dialect, self._validation_schema())
+
+    def validate_many(
+        self, queries: list[str], *, max_workers: int | None = None
+    ) -> list[ValidationResult]:
+        """
+        Checks many queries against the seeded schema without executing them.
+        Large batches are spread across a process pool.
+
+        Args:
+            queries (list[str]): SQL queries to validate
+            max_workers (int | None): Worker processes; 1 forces in-process validation.
+
+        Returns:
+            list[ValidationResult]: One result per query, in input order.
+        """
+        return validate_queries(
+            queries,
+            self.read_dialect,
+            self.seeder.catalog(),
+            schema=self._validation_schema(),
+            max_workers=max_workers,
+        )
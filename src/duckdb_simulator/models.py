@@ -1,3 +1,4 @@
+from dataclasses import dataclass
 from enum import Enum
 
 
@@ -31,3 +32,50 @@ class Dialect(str, Enum):
         if dialect == cls.AZURE_SYNAPSE:
             return "tsql"
         return dialect
+
+
+@dataclass(frozen=True)
+class QueryStats:
+    """
+    Timing and resource figures recorded for a single query_to_df call.
+    """
+
+    query: str
+    translated_query: str
+    translate_seconds: float
+    execute_seconds: float
+    rows: int
+    peak_memory_bytes: int | None = None
+    peak_temp_bytes: int | None = None
+    sample_rate: float | None = None
+    # Building the samples a sampled query reads on first use; not part of total_seconds
+    sample_build_seconds: float = 0.0
+
+    @property
+    def total_seconds(self) -> float:
+        """Translation plus execution time."""
+        return self.translate_seconds + self.execute_seconds
+
+    @property
+    def estimated_full_seconds(self) -> float:
+        """
+        Rough runtime on the full data, assuming execution time scales linearly
+        with the number of rows sampled. Equals total_seconds without sampling.
+        """
+        if not self.sample_rate:
+            return self.total_seconds
+        return self.translate_seconds + self.execute_seconds / self.sample_rate
+
+
+@dataclass(frozen=True)
+class ExportResult:
+    """
+    Outcome of a query_to_file call: where the rows went and how much was written.
+    """
+
+    path: str
+    format: str
+    rows: int
+    bytes_written: int
+    files: tuple[str, ...]
+    stats: QueryStats
@@ -0,0 +1,227 @@
+"""
+duckdb_simulator.profiling
+--------------------------
+Structured views over DuckDB's JSON profiling output, used by
+``DuckdbSQLExecutor.profile()`` and the executor's slow-query log, and
+per-fingerprint aggregation of query timings, used by the pytest session report.
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, field
+from collections.abc import Callable
+from typing import Any, Iterator
+
+import sqlglot
+from sqlglot import exp
+
+from .models import QueryStats
+
+# Wrapper operator DuckDB puts on top of the real plan for EXPLAIN ANALYZE.
+_EXPLAIN_ANALYZE = "EXPLAIN_ANALYZE"
+
+
+@dataclass(frozen=True)
+class OperatorProfile:
+    """A single physical operator with its timing and output cardinality."""
+
+    name: str
+    timing_seconds: float
+    cardinality: int
+    extra_info: dict[str, Any] = field(default_factory=dict)
+    children: tuple[OperatorProfile, ...] = ()
+
+    def walk(self) -> Iterator[OperatorProfile]:
+        """Yield this operator and all its descendants, depth first."""
+        yield self
+        for child in self.children:
+            yield from child.walk()
+
+
+@dataclass(frozen=True)
+class QueryProfile:
+    """Operator tree and query-level metrics for one translated query."""
+
+    query: str
+    translated_query: str
+    latency_seconds: float | None
+    peak_memory_bytes: int | None
+    operators: tuple[OperatorProfile, ...] = ()
+
+    def walk(self) -> Iterator[OperatorProfile]:
+        """Yield every operator in the plan, depth first."""
+        for operator in self.operators:
+            yield from operator.walk()
+
+    def slowest(self, n: int = 5) -> list[OperatorProfile]:
+        """Return the ``n`` operators with the highest own timing."""
+        return sorted(self.walk(), key=lambda op: op.timing_seconds, reverse=True)[:n]
+
+    def render(self) -> str:
+        """Render the operator tree as indented text, one operator per line."""
+        lines: list[str] = []
+
+        def _render(operator: OperatorProfile, depth: int) -> None:
+            lines.append(
+                f"{'  ' * depth}{operator.name} "
+                f"(rows={operator.cardinality}, time={operator.timing_seconds:.6f}s)"
+            )
+            for child in operator.children:
+                _render(child, depth + 1)
+
+        for operator in self.operators:
+            _render(operator, 0)
+        return "\n".join(lines)
+
+
+@dataclass(frozen=True)
+class SlowQuery:
+    """Entry of the executor's slow-query log."""
+
+    query: str
+    translated_query: str
+    elapsed_seconds: float
+    profile: QueryProfile
+
+
+def _parse_operator(node: dict[str, Any]) -> OperatorProfile:
+    return OperatorProfile(
+        name=node.get("operator_name") or node.get("operator_type", "UNKNOWN"),
+        timing_seconds=float(node.get("operator_timing", 0.0)),
+        cardinality=int(node.get("operator_cardinality", 0)),
+        extra_info=node.get("extra_info") or {},
+        children=tuple(_parse_operator(child) for child in node.get("children", [])),
+    )
+
+
+def parse_profile(
+    raw: dict[str, Any], *, query: str, translated_query: str
+) -> QueryProfile:
+    """Build a QueryProfile from DuckDB's JSON profiling output.
+
+    Args:
+        raw:              Decoded JSON returned by DuckDB's profiler.
+        query:            Original query, in the source dialect.
+        translated_query: DuckDB SQL that was profiled.
+
+    Returns:
+        QueryProfile: The operator tree, without DuckDB's EXPLAIN ANALYZE wrapper.
+    """
+    operators = tuple(_parse_operator(child) for child in raw.get("children", []))
+    if len(operators) == 1 and operators[0].name == _EXPLAIN_ANALYZE:
+        operators = operators[0].children
+    return QueryProfile(
+        query=query,
+        translated_query=translated_query,
+        latency_seconds=raw.get("latency"),
+        peak_memory_bytes=raw.get("system_peak_buffer_memory"),
+        operators=operators,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Query fingerprints
+# ---------------------------------------------------------------------------
+
+
+def _strip_literal(node: exp.Expression) -> exp.Expression:
+    if isinstance(node, exp.Literal) or (
+        isinstance(node, exp.Neg) and isinstance(node.this, exp.Literal)
+    ):
+        return exp.Placeholder()
+    return node
+
+
+def fingerprint(query: str, dialect: str | None = None) -> str:
+    """Normalize a query so calls differing only in literal values share a fingerprint.
+
+    Literals become ``?`` and ``IN (?, ?, ...)`` lists collapse to ``IN (?)``.
+    Queries sqlglot cannot parse fall back to their whitespace-collapsed text.
+
+    Args:
+        query:   SQL query.
+        dialect: sqlglot dialect of ``query``; the fingerprint is written in it too.
+    """
+    try:
+        expression = sqlglot.parse_one(query, read=dialect).transform(_strip_literal)
+    except Exception:
+        return " ".join(query.split())
+    for in_list in expression.find_all(exp.In):
+        values = in_list.expressions
+        if len(values) > 1 and all(isinstance(v, exp.Placeholder) for v in values):
+            in_list.set("expressions", [exp.Placeholder()])
+    return expression.sql(dialect=dialect, normalize=True)
+
+
+@dataclass
+class FingerprintStats:
+    """Aggregated timings of every recorded call sharing one fingerprint."""
+
+    fingerprint: str
+    calls: int = 0
+    translate_seconds: float = 0.0
+    execute_seconds: float = 0.0
+    tests: list[str] = field(default_factory=list)
+
+    @property
+    def total_seconds(self) -> float:
+        return self.translate_seconds + self.execute_seconds
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "fingerprint": self.fingerprint,
+            "calls": self.calls,
+            "total_seconds": self.total_seconds,
+            "translate_seconds": self.translate_seconds,
+            "execute_seconds": self.execute_seconds,
+            "tests": self.tests,
+        }
+
+
+class QueryRecorder:
+    """Collects QueryStats from executors and aggregates them by fingerprint.
+
+    Fingerprints are computed once per distinct query text, when ``summary()``
+    is called, so recording a call only appends to a list.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: list[tuple[QueryStats, str | None, str | None]] = []
+
+    def listener(
+        self, dialect: str | None = None, test: str | None = None
+    ) -> Callable[[QueryStats], None]:
+        """Return a callback for ``DuckdbSQLExecutor.listeners`` tagging calls with a test id."""
+
+        def _record(stats: QueryStats) -> None:
+            with self._lock:
+                self._calls.append((stats, dialect, test))
+
+        return _record
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    def summary(self) -> list[FingerprintStats]:
+        """Aggregated stats per fingerprint, by total time, slowest first."""
+        fingerprints: dict[tuple[str, str | None], str] = {}
+        by_fingerprint: dict[str, FingerprintStats] = {}
+        with self._lock:
+            calls = list(self._calls)
+        for stats, dialect, test in calls:
+            key = (stats.query, dialect)
+            if key not in fingerprints:
+                fingerprints[key] = fingerprint(stats.query, dialect)
+            entry = by_fingerprint.setdefault(
+                fingerprints[key], FingerprintStats(fingerprints[key])
+            )
+            entry.calls += 1
+            entry.translate_seconds += stats.translate_seconds
+            entry.execute_seconds += stats.execute_seconds
+            if test is not None and test not in entry.tests:
+                entry.tests.append(test)
+        return sorted(
+            by_fingerprint.values(), key=lambda entry: entry.total_seconds, reverse=True
+        )
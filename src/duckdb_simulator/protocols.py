@@ -9,12 +9,19 @@ class SQLExecutor(Protocol):
     Compatible with SQLExecutor2.query_to_df
     """
 
-    def query_to_df(self, query: str) -> pd.DataFrame:
+    def query_to_df(
+        self,
+        query: str,
+        pre_queries: list[str] | None = None,
+        post_queries: list[str] | None = None,
+    ) -> pd.DataFrame:
         """
         Executes a SQL query and returns results as DataFrame.
 
         Args:
             query (str): SQL query to execute
+            pre_queries (list[str] | None): Statements executed before the query
+            post_queries (list[str] | None): Statements executed after the query
 
         Returns:
             pd.DataFrame: Result of SQL query
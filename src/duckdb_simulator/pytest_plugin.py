@@ -8,48 +8,177 @@ Ready-made pytest fixtures. Register in conftest.py:
 Or selectively:
 
     from duckdb_simulator.pytest_plugin import orders_executor
+
+Registering the module as a plugin (``pytest_plugins = ["duckdb_simulator.pytest_plugin"]``)
+also enables the query report options:
+
+    --duckdb-report              print the slowest query fingerprints at the end of the session
+    --duckdb-report-top=N        number of fingerprints to print (default 10)
+    --duckdb-report-json=PATH    write every fingerprint's stats to a JSON file
+    --duckdb-warmup=DIALECTS     warm up sqlglot and DuckDB for comma-separated dialects
+                                 in the background during collection
 """
 
 from __future__ import annotations
 
+import json
+
 import pytest
 
 from .executor import DuckdbSQLExecutor
-from .fixtures import FULL, ORDERS, PRODUCTS, USERS
 from .models import Dialect
+from .profiling import QueryRecorder
 from .seeder import DuckdbSQLSeeder
+from .warmup import Warmup, start_warmup
+
+_recorder_key = pytest.StashKey[QueryRecorder]()
+_warmups_key = pytest.StashKey[list[Warmup]]()
+
+# ---------------------------------------------------------------------------
+# Query report hooks
+# ---------------------------------------------------------------------------
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("duckdb-simulator")
+    group.addoption(
+        "--duckdb-report",
+        action="store_true",
+        default=False,
+        help="Print the query fingerprints that took the most time.",
+    )
+    group.addoption(
+        "--duckdb-report-top",
+        type=int,
+        default=10,
+        metavar="N",
+        help="Number of fingerprints in the query report (default 10).",
+    )
+    group.addoption(
+        "--duckdb-report-json",
+        default=None,
+        metavar="PATH",
+        help="Write per-fingerprint query stats to a JSON file.",
+    )
+    group.addoption(
+        "--duckdb-warmup",
+        default=None,
+        metavar="DIALECTS",
+        help="Comma-separated sqlglot dialects to warm up in a background thread, "
+        "e.g. 'tsql,snowflake'.",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    if config.getoption("--duckdb-report", False) or config.getoption(
+        "--duckdb-report-json", None
+    ):
+        config.stash[_recorder_key] = QueryRecorder()
+    dialects = config.getoption("--duckdb-warmup", None)
+    if dialects:
+        config.stash[_warmups_key] = [
+            start_warmup(Dialect.to_sqlglot_dialect(dialect.strip()))
+            for dialect in dialects.split(",")
+            if dialect.strip()
+        ]
+
+
+def _write_warmup_report(terminalreporter, warmups: list[Warmup]) -> None:
+    terminalreporter.write_sep("=", "duckdb-simulator warm-up")
+    for warmup in warmups:
+        try:
+            report = warmup.wait(timeout=5)
+        except Exception as e:
+            terminalreporter.write_line(f"{warmup.read_dialect}: failed ({e})")
+            continue
+        if report is None:
+            terminalreporter.write_line(f"{warmup.read_dialect}: still running")
+            continue
+        terminalreporter.write_line(
+            f"{report.dialect}: cold {report.cold_seconds * 1000:.1f} ms, "
+            f"warm {report.warm_seconds * 1000:.1f} ms"
+        )
+
+
+def pytest_terminal_summary(terminalreporter, config: pytest.Config) -> None:
+    warmups = config.stash.get(_warmups_key, None)
+    if warmups:
+        _write_warmup_report(terminalreporter, warmups)
+
+    recorder = config.stash.get(_recorder_key, None)
+    if recorder is None:
+        return
+    summary = recorder.summary()
+
+    path = config.getoption("--duckdb-report-json")
+    if path:
+        with open(path, "w") as f:
+            json.dump([entry.to_dict() for entry in summary], f, indent=2)
+
+    if not config.getoption("--duckdb-report"):
+        return
+    terminalreporter.write_sep("=", "duckdb-simulator query report")
+    total = sum(entry.total_seconds for entry in summary)
+    terminalreporter.write_line(
+        f"{len(recorder)} queries, {len(summary)} fingerprints, {total:.3f}s total"
+    )
+    for entry in summary[: config.getoption("--duckdb-report-top")]:
+        terminalreporter.write_line("")
+        terminalreporter.write_line(
+            f"{entry.total_seconds:.3f}s  calls={entry.calls}  "
+            f"translate={entry.translate_seconds:.3f}s  "
+            f"execute={entry.execute_seconds:.3f}s"
+        )
+        terminalreporter.write_line(f"  {entry.fingerprint}")
+        for test in entry.tests[:5]:
+            terminalreporter.write_line(f"    {test}")
+        if len(entry.tests) > 5:
+            terminalreporter.write_line(f"    ... and {len(entry.tests) - 5} more")
+
+
+def _executor(
+    request: pytest.FixtureRequest, seeder: DuckdbSQLSeeder
+) -> DuckdbSQLExecutor:
+    """Build a DuckDB-dialect executor, recorded in the query report when enabled."""
+    executor = DuckdbSQLExecutor(dialect=Dialect.DUCKDB, seeder=seeder)
+    recorder = request.config.stash.get(_recorder_key, None)
+    if recorder is not None:
+        executor.listeners.append(
+            recorder.listener(executor.read_dialect, request.node.nodeid)
+        )
+    return executor
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
 
 
 @pytest.fixture
-def orders_executor() -> DuckdbSQLExecutor:
+def orders_executor(request: pytest.FixtureRequest) -> DuckdbSQLExecutor:
     """DuckDB executor pre-seeded with the generic orders table."""
-    seeder = DuckdbSQLSeeder(ORDERS)
-    return DuckdbSQLExecutor(dialect=Dialect.DUCKDB, seeder=seeder)
+    return _executor(request, DuckdbSQLSeeder.from_dataset("orders"))
 
 
 @pytest.fixture
-def products_executor() -> DuckdbSQLExecutor:
+def products_executor(request: pytest.FixtureRequest) -> DuckdbSQLExecutor:
     """DuckDB executor pre-seeded with the generic products table."""
-    seeder = DuckdbSQLSeeder(PRODUCTS)
-    return DuckdbSQLExecutor(dialect=Dialect.DUCKDB, seeder=seeder)
+    return _executor(request, DuckdbSQLSeeder.from_dataset("products"))
 
 
 @pytest.fixture
-def users_executor() -> DuckdbSQLExecutor:
+def users_executor(request: pytest.FixtureRequest) -> DuckdbSQLExecutor:
     """DuckDB executor pre-seeded with the generic users table."""
-    seeder = DuckdbSQLSeeder(USERS)
-    return DuckdbSQLExecutor(dialect=Dialect.DUCKDB, seeder=seeder)
+    return _executor(request, DuckdbSQLSeeder.from_dataset("users"))
 
 
 @pytest.fixture
-def full_executor() -> DuckdbSQLExecutor:
+def full_executor(request: pytest.FixtureRequest) -> DuckdbSQLExecutor:
     """DuckDB executor pre-seeded with orders + products + users tables."""
-    seeder = DuckdbSQLSeeder(FULL)
-    return DuckdbSQLExecutor(dialect=Dialect.DUCKDB, seeder=seeder)
+    return _executor(request, DuckdbSQLSeeder.from_dataset("full"))
 
 
 @pytest.fixture
-def blank_executor() -> DuckdbSQLExecutor:
+def blank_executor(request: pytest.FixtureRequest) -> DuckdbSQLExecutor:
     """DuckDB executor with no tables — seed it yourself via FixtureBuilder."""
-    seeder = DuckdbSQLSeeder({"_empty": [{"_": 1}]})
-    return DuckdbSQLExecutor(dialect=Dialect.DUCKDB, seeder=seeder)
+    return _executor(request, DuckdbSQLSeeder({"_empty": [{"_": 1}]}))
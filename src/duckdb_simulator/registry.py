@@ -0,0 +1,116 @@
+"""
+duckdb_simulator.registry
+-------------------------
+Named seed datasets, converted to Arrow tables once per process.
+
+Building a DuckdbSQLSeeder from a list-of-dicts dataset normally goes
+list-of-dicts → pandas → DuckDB every time. Registered datasets pay for that
+conversion on first use only; every later seeder is created from the cached,
+immutable Arrow tables. The built-in ``fixtures`` datasets are pre-registered
+as ``"orders"``, ``"products"``, ``"users"`` and ``"full"``.
+
+Example::
+
+    register_dataset("sales", {"sales": [{"id": 1, "amount": 10.0}]})
+    seeder = DuckdbSQLSeeder.from_dataset("sales")
+
+Passing a registered dict directly (``DuckdbSQLSeeder(fixtures.FULL)``) hits
+the same cache.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any
+
+import duckdb
+import pandas as pd
+import pyarrow as pa
+
+from . import fixtures
+
+ArrowTables = Mapping[str, pa.Table]
+
+_lock = threading.Lock()
+# name -> source data, as registered
+_sources: dict[str, Mapping[str, Any]] = {}
+# name -> converted tables, filled on first use
+_converted: dict[str, ArrowTables] = {}
+
+
+def register_dataset(name: str, data: Mapping[str, Any]) -> None:
+    """Register a dataset under ``name``. It is converted to Arrow on first use.
+
+    Args:
+        name: Dataset name, passed later to ``get_dataset`` or ``DuckdbSQLSeeder.from_dataset``.
+        data: Mapping of table names to rows (list of dicts), DataFrames or Arrow tables.
+
+    Raises:
+        ValueError: If another dataset is already registered under ``name``.
+    """
+    with _lock:
+        existing = _sources.get(name)
+        if existing is not None and existing is not data:
+            raise ValueError(f"Dataset '{name}' is already registered.")
+        _sources[name] = data
+
+
+def unregister_dataset(name: str) -> None:
+    """Remove a dataset and its cached Arrow tables. Unknown names are ignored."""
+    with _lock:
+        _sources.pop(name, None)
+        _converted.pop(name, None)
+
+
+def dataset_names() -> list[str]:
+    """Names of all registered datasets, sorted."""
+    with _lock:
+        return sorted(_sources)
+
+
+def _to_arrow(table_data: Any) -> pa.Table:
+    """Convert one table to Arrow with the same types a pandas-based seed would get."""
+    if isinstance(table_data, pa.Table):
+        return table_data
+    if isinstance(table_data, list):
+        table_data = pd.DataFrame(table_data)
+    with duckdb.connect(":memory:") as conn:
+        return conn.from_df(table_data).to_arrow_table()
+
+
+def get_dataset(name: str) -> ArrowTables:
+    """Return the read-only Arrow tables of a registered dataset, converting it once.
+
+    Raises:
+        KeyError: If no dataset is registered under ``name``.
+    """
+    with _lock:
+        tables = _converted.get(name)
+        if tables is None:
+            if name not in _sources:
+                raise KeyError(
+                    f"Unknown dataset '{name}'. Registered: {sorted(_sources)}"
+                )
+            tables = MappingProxyType(
+                {
+                    table_name: _to_arrow(table_data)
+                    for table_name, table_data in _sources[name].items()
+                }
+            )
+            _converted[name] = tables
+        return tables
+
+
+def lookup(data: Mapping[str, Any]) -> ArrowTables | None:
+    """Return the cached Arrow tables if ``data`` is a registered dataset object."""
+    with _lock:
+        name = next((name for name, source in _sources.items() if source is data), None)
+    return None if name is None else get_dataset(name)
+
+
+register_dataset("orders", fixtures.ORDERS)
+register_dataset("products", fixtures.PRODUCTS)
+register_dataset("users", fixtures.USERS)
+register_dataset("full", fixtures.FULL)
@@ -1,9 +1,29 @@
 import duckdb
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Union, Dict, Any, Optional, Sequence, Mapping, Callable
 import json
-from typing import Union, Dict, Any
 import os
 import re
+import time
+
+from . import registry
+
+_IDENTIFIER = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*$")
+
+# DuckDB table functions used to read one table per file, by file extension.
+_FILE_READERS = {
+    ".csv": "read_csv",
+    ".json": "read_json",
+    ".jsonl": "read_json",
+    ".ndjson": "read_json",
+    ".parquet": "read_parquet",
+}
+
+# Below this many tables, cursor and thread setup outweighs parallel loading, so the
+# default seeds them sequentially.
+_PARALLEL_SEED_MIN_TABLES = 8
 
 
 class DuckdbSQLSeeder:
@@ -11,16 +31,94 @@ class DuckdbSQLSeeder:
     Seeds a DuckDB database with mock data from JSON configuration or python dictionaries.
     """
 
-    def __init__(self, config: Union[str, Dict[str, Any]]):
+    def __init__(
+        self,
+        config: Union[str, os.PathLike, Dict[str, Any], None] = None,
+        *,
+        database: str = ":memory:",
+        read_only: bool = False,
+        lazy: bool = False,
+        seed_workers: Optional[int] = None,
+        threads: Optional[int] = None,
+        memory_limit: Optional[str] = None,
+        temp_directory: Optional[str] = None,
+        preserve_insertion_order: Optional[bool] = None,
+    ):
         """
         Initializes the DuckDB connection and seeds it based on the config.
 
         Args:
-            config (Union[str, Dict[str, Any]]): A file path to a JSON configuration
-                                                 or a dictionary mapping table names to data (list of dicts).
+            config (Union[str, os.PathLike, Dict[str, Any]]): A JSON file mapping table names to rows,
+                a single NDJSON / CSV / Parquet file, a directory with one such file per table,
+                or a dictionary mapping table names to data (list of dicts).
+                Files are read by DuckDB directly, without building Python objects.
+                None opens ``database`` as is, without seeding.
+            database (str): DuckDB database file, or ":memory:" (default) for an in-memory DB.
+            read_only (bool): Open ``database`` read-only, e.g. to share a saved DB between
+                              processes. Requires config to be None.
+            lazy (bool): Expose single-file and directory tables as views that scan the files
+                         on every query instead of loading them into memory.
+            seed_workers (Optional[int]): Tables converted and ingested concurrently, each on its
+                                          own cursor. Defaults to the CPU count, capped by threads,
+                                          for configs of 8 tables or more, and to sequential
+                                          seeding below that; 1 always seeds sequentially.
+            threads (Optional[int]): Maximum number of DuckDB worker threads. Defaults to all cores.
+            memory_limit (Optional[str]): DuckDB memory limit, e.g. "2GB". Defaults to 80% of RAM.
+            temp_directory (Optional[str]): Directory used to spill intermediates that exceed memory_limit.
+            preserve_insertion_order (Optional[bool]): Set to False to let DuckDB reorder results
+                                                       and use less memory on large scans.
+        """
+        if read_only and config is not None:
+            raise ValueError("A read-only database cannot be seeded; pass config=None.")
+        self.conn = duckdb.connect(  # In-memory DB by default for tests
+            database,
+            read_only=read_only,
+            config=self._connection_config(
+                threads=threads,
+                memory_limit=memory_limit,
+                temp_directory=temp_directory,
+                preserve_insertion_order=preserve_insertion_order,
+            ),
+        )
+        self.lazy = lazy
+        self.seed_workers = seed_workers
+        self._threads = threads
+        # Seconds spent converting and ingesting each seeded table
+        self.seed_timings: Dict[str, float] = {}
+        self._catalog: Optional[Dict[str, Dict[str, str]]] = None
+        self._samples: Dict[str, list] = {}
+        if config is not None:
+            self._seed(config)
+
+    @classmethod
+    def from_dataset(cls, name: str, **kwargs: Any) -> "DuckdbSQLSeeder":
+        """
+        Creates a seeder from a registered dataset, converted to Arrow once per process.
+
+        Args:
+            name (str): Dataset name, e.g. "orders", "full" or one passed to register_dataset.
+            **kwargs: Connection options accepted by the constructor (threads, memory_limit, ...).
+
+        Raises:
+            KeyError: If no dataset is registered under ``name``
         """
-        self.conn = duckdb.connect(":memory:")  # Use in-memory DB for tests
-        self._seed(config)
+        tables = registry.get_dataset(name)
+        seeder = cls(**kwargs)
+        seeder._seed_tables(tables)
+        return seeder
+
+    @staticmethod
+    def _connection_config(**settings: Any) -> Dict[str, Any]:
+        """
+        Builds the DuckDB connection config, leaving unset options at DuckDB's defaults.
+
+        Raises:
+            ValueError: If threads is not a positive integer
+        """
+        threads = settings.get("threads")
+        if threads is not None and threads < 1:
+            raise ValueError(f"threads must be a positive integer, got {threads}.")
+        return {key: value for key, value in settings.items() if value is not None}
 
     def _validate_table_name(self, name: str) -> None:
         """
@@ -32,39 +130,463 @@ class DuckdbSQLSeeder:
         Raises:
             ValueError: If table name contains invalid characters
         """
-        if not re.match(r"^[a-zA-Z_][a-zA-Z0-9_]*$", name):
+        if not _IDENTIFIER.match(name):
             raise ValueError(
                 f"Invalid table name: '{name}'. "
                 "Table names must start with a letter or underscore and contain only alphanumeric characters and underscores."
             )
 
-    def _seed(self, config: Union[str, Dict[str, Any]]) -> None:
+    def _validate_column_name(self, name: str) -> None:
+        """
+        Validates that a key column name follows SQL identifier rules to prevent SQL injection.
+
+        Raises:
+            ValueError: If column name contains invalid characters
+        """
+        if not _IDENTIFIER.match(name):
+            raise ValueError(
+                f"Invalid column name: '{name}'. "
+                "Column names must start with a letter or underscore and contain only alphanumeric characters and underscores."
+            )
+
+    def _load(
+        self,
+        table_name: str,
+        table_data: Any,
+        statement: str,
+        conn: Optional[duckdb.DuckDBPyConnection] = None,
+    ) -> list:
+        """
+        Registers table data as a temporary view and runs a statement reading from it.
+
+        Args:
+            table_name (str): Target table, used to build a unique temporary view name
+            table_data (Any): List of dicts, pandas DataFrame or Arrow table
+            statement (str): SQL with a ``{source}`` placeholder for the temporary view
+            conn (Optional[duckdb.DuckDBPyConnection]): Cursor to use instead of the main connection
+
+        Returns:
+            list: Rows returned by the (last) statement
+        """
+        conn = conn or self.conn
+        # Convert list of dicts to pandas DataFrame, which DuckDB can read natively.
+        # DataFrames and Arrow tables are scanned in place, without a copy.
+        if isinstance(table_data, list):
+            table_data = pd.DataFrame(table_data)
+
+        # Use a unique temporary name based on the table to avoid conflicts
+        temp_name = f"_temp_{table_name}_{id(table_data)}"
+        conn.register(temp_name, table_data)
+        try:
+            return conn.execute(statement.format(source=temp_name)).fetchall()
+        finally:
+            conn.unregister(temp_name)
+
+    def _run_seed_jobs(
+        self, jobs: Dict[str, Callable[[duckdb.DuckDBPyConnection], None]]
+    ) -> None:
+        """
+        Runs one job per table, concurrently on separate cursors when several workers
+        are available, and records the time each job took in ``seed_timings``.
+        """
+
+        def _timed(
+            table_name: str, job: Callable, conn: duckdb.DuckDBPyConnection
+        ) -> None:
+            started = time.perf_counter()
+            job(conn)
+            self.seed_timings[table_name] = time.perf_counter() - started
+
+        workers = min(
+            len(jobs), self.seed_workers or self._default_seed_workers(len(jobs))
+        )
+        if workers <= 1:
+            for table_name, job in jobs.items():
+                _timed(table_name, job, self.conn)
+            return
+
+        def _on_cursor(table_name: str, job: Callable) -> None:
+            # A cursor is a separate connection to the same in-memory database
+            cursor = self.conn.cursor()
+            try:
+                _timed(table_name, job, cursor)
+            finally:
+                cursor.close()
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(_on_cursor, table_name, job)
+                for table_name, job in jobs.items()
+            ]
+            for future in futures:
+                future.result()
+
+    def _default_seed_workers(self, tables: int) -> int:
+        """Workers used when seed_workers is unset, kept within the threads limit."""
+        if tables < _PARALLEL_SEED_MIN_TABLES:
+            return 1
+        return min(os.cpu_count() or 1, self._threads or os.cpu_count() or 1)
+
+    def _seed(self, config: Union[str, os.PathLike, Dict[str, Any]]) -> None:
         """Seeds database with provided configuration."""
-        data_dict = {}
-        if isinstance(config, str) and os.path.exists(config):
-            with open(config, "r") as f:
-                data_dict = json.load(f)
-        elif isinstance(config, dict):
-            data_dict = config
-        else:
+        if isinstance(config, (str, os.PathLike)) and os.path.isdir(config):
+            self._seed_directory(os.fspath(config))
+            return
+        if isinstance(config, (str, os.PathLike)) and os.path.isfile(config):
+            path = os.fspath(config)
+            stem, extension = os.path.splitext(os.path.basename(path))
+            if extension.lower() == ".json":
+                self._seed_json_manifest(path)
+            else:
+                self._seed_file(stem, path)
+            return
+        if not isinstance(config, dict):
             raise ValueError("Config must be a valid file path or a dictionary.")
 
-        for table_name, table_data in data_dict.items():
-            # Validate table name to prevent SQL injection
+        # Registered datasets (e.g. fixtures.FULL) are seeded from cached Arrow tables
+        cached = registry.lookup(config)
+        self._seed_tables(config if cached is None else cached)
+
+    def _seed_tables(self, tables: Mapping[str, Any]) -> None:
+        """Creates one table per entry of a mapping of table names to data."""
+        # Validate every table name to prevent SQL injection, before loading anything
+        for table_name in tables:
             self._validate_table_name(table_name)
 
-            # Convert list of dicts to pandas DataFrame, which DuckDB can read natively.
-            df = pd.DataFrame(table_data)
+        self._run_seed_jobs(
+            {
+                table_name: partial(
+                    self._load,
+                    table_name,
+                    table_data,
+                    f"CREATE TABLE {table_name} AS SELECT * FROM {{source}}",
+                )
+                for table_name, table_data in tables.items()
+            }
+        )
 
-            # Register dataframe directly as a table in duckdb
-            # Use a unique temporary name based on the table to avoid conflicts
-            temp_name = f"_temp_{table_name}_{id(df)}"
-            self.conn.register(temp_name, df)
-            self.conn.execute(f"CREATE TABLE {table_name} AS SELECT * FROM {temp_name}")
-            self.conn.unregister(temp_name)
+    def _seed_directory(self, directory: str) -> None:
+        """Creates one table per supported file in a directory, named after the file."""
+        entries = sorted(
+            entry
+            for entry in os.listdir(directory)
+            if os.path.splitext(entry)[1].lower() in _FILE_READERS
+        )
+        if not entries:
+            raise ValueError(
+                f"No supported data files in directory '{directory}'. "
+                f"Expected one of: {', '.join(sorted(_FILE_READERS))}."
+            )
+        for entry in entries:
+            self._validate_table_name(os.path.splitext(entry)[0])
+        self._run_seed_jobs(
+            {
+                os.path.splitext(entry)[0]: partial(
+                    self._seed_file,
+                    os.path.splitext(entry)[0],
+                    os.path.join(directory, entry),
+                )
+                for entry in entries
+            }
+        )
+
+    def _seed_file(
+        self,
+        table_name: str,
+        path: str,
+        conn: Optional[duckdb.DuckDBPyConnection] = None,
+    ) -> None:
+        """Creates a table (or a view, if lazy) over a single data file."""
+        self._validate_table_name(table_name)
+        extension = os.path.splitext(path)[1].lower()
+        reader = _FILE_READERS.get(extension)
+        if reader is None:
+            raise ValueError(
+                f"Unsupported data file '{path}'. "
+                f"Expected one of: {', '.join(sorted(_FILE_READERS))}."
+            )
+        kind = "VIEW" if self.lazy else "TABLE"
+        (conn or self.conn).execute(
+            f"CREATE {kind} {table_name} AS SELECT * FROM {reader}({_quote(path)})"
+        )
+
+    def _seed_json_manifest(self, path: str) -> None:
+        """
+        Creates one table per key of a JSON object mapping table names to lists of rows.
+        The file is parsed by DuckDB once, into a temporary table holding one JSON list
+        per key. Column types follow what the pandas path gives for the same rows:
+        strings are never detected as dates, times or UUIDs, integer columns are
+        BIGINT, UBIGINT or HUGEINT depending on their range, and those with nulls or
+        missing keys become DOUBLE. Integers nested in objects or lists keep the type
+        DuckDB's JSON reader gives them.
+        """
+        # read_json rejects objects larger than maximum_object_size (16MB by default).
+        # maximum_depth = 1 keeps each table as raw JSON, with no type detection.
+        max_size = os.path.getsize(path) + 1
+        self.conn.execute(
+            "CREATE TEMP TABLE _manifest AS SELECT * FROM "
+            f"read_json({_quote(path)}, maximum_object_size = {max_size}, "
+            "maximum_depth = 1)"
+        )
+        try:
+            table_names = [
+                row[0] for row in self.conn.execute("DESCRIBE _manifest").fetchall()
+            ]
+            for table_name in table_names:
+                # Validate table name to prevent SQL injection
+                self._validate_table_name(table_name)
+                (structure,) = self.conn.execute(
+                    f"SELECT json_structure({table_name}) FROM _manifest"
+                ).fetchone()
+                structure = json.loads(structure)
+                if not (
+                    isinstance(structure, list)
+                    and len(structure) == 1
+                    and isinstance(structure[0], dict)
+                ):
+                    raise ValueError(
+                        f"Table '{table_name}' in '{path}' must be a non-empty list of objects."
+                    )
+                structure = _pandas_json_structure(structure)
+                self.conn.execute(
+                    f"CREATE TABLE {table_name} AS SELECT _row.* FROM "
+                    f"(SELECT unnest(from_json({table_name}, {_quote(json.dumps(structure))})) "
+                    "AS _row FROM _manifest)"
+                )
+                self._match_pandas_integers(table_name, structure[0])
+        finally:
+            self.conn.execute("DROP TABLE _manifest")
+
+    def _match_pandas_integers(self, table_name: str, columns: Dict[str, Any]) -> None:
+        """
+        Gives integer columns the type pandas infers from their values: BIGINT when
+        they fit int64, UBIGINT when they only fit uint64, DOUBLE for either with
+        nulls, and HUGEINT otherwise, where pandas keeps Python ints.
+        """
+        integers = {
+            '"' + name.replace('"', '""') + '"': kind
+            for name, kind in columns.items()
+            if kind in _JSON_INTEGER_TYPES
+        }
+        if not integers:
+            return
+        ranges = self.conn.execute(
+            "SELECT "
+            + ", ".join(
+                f"MIN({column}), MAX({column}), COUNT(*) > COUNT({column})"
+                for column in integers
+            )
+            + f" FROM {table_name}"
+        ).fetchone()
+        for i, (column, kind) in enumerate(integers.items()):
+            low, high, nullable = ranges[3 * i : 3 * i + 3]
+            if _INT64_MIN <= low and high <= _INT64_MAX:
+                target = "DOUBLE" if nullable else "BIGINT"
+            elif low >= 0:
+                target = "DOUBLE" if nullable else "UBIGINT"
+            else:
+                target = "HUGEINT"
+            if target != kind:
+                self.conn.execute(
+                    f"ALTER TABLE {table_name} ALTER {column} TYPE {target}"
+                )
+
+    def append(self, table: str, data: Any) -> None:
+        """
+        Appends rows to an existing table. Columns are matched by name.
+
+        Args:
+            table (str): Name of a seeded table
+            data (Any): List of dicts, pandas DataFrame or Arrow table
+
+        Raises:
+            ValueError: If table name contains invalid characters
+            duckdb.Error: If the table does not exist or the columns do not match
+        """
+        self._validate_table_name(table)
+        if isinstance(data, list) and not data:
+            return
+        self._drop_samples(table)
+        self._load(table, data, f"INSERT INTO {table} BY NAME SELECT * FROM {{source}}")
+
+    def upsert(self, table: str, data: Any, key: Union[str, Sequence[str]]) -> None:
+        """
+        Inserts rows, replacing existing rows that share the same key, in one transaction.
+
+        Args:
+            table (str): Name of a seeded table
+            data (Any): List of dicts, pandas DataFrame or Arrow table
+            key (Union[str, Sequence[str]]): Column or columns identifying a row
+
+        Raises:
+            ValueError: If table or key names contain invalid characters, no key is given,
+                        or two rows of data share the same key
+            duckdb.Error: If the table does not exist or the columns do not match
+        """
+        self._validate_table_name(table)
+        keys = [key] if isinstance(key, str) else list(key)
+        if not keys:
+            raise ValueError("upsert requires at least one key column.")
+        for column in keys:
+            self._validate_column_name(column)
+        if isinstance(data, list):
+            if not data:
+                return
+            # Converted once here rather than on each _load below
+            data = pd.DataFrame(data)
+
+        columns = ", ".join(keys)
+        duplicate = self._load(
+            table,
+            data,
+            f"SELECT {columns} FROM {{source}} GROUP BY {columns} "
+            "HAVING COUNT(*) > 1 LIMIT 1",
+        )
+        if duplicate:
+            raise ValueError(
+                f"upsert data holds several rows with key "
+                f"{dict(zip(keys, duplicate[0]))}."
+            )
+        self._drop_samples(table)
+
+        matches = " AND ".join(
+            f"{table}.{column} IS NOT DISTINCT FROM {{source}}.{column}"
+            for column in keys
+        )
+        self.conn.begin()
+        try:
+            self._load(
+                table,
+                data,
+                f"DELETE FROM {table} USING {{source}} WHERE {matches}; "
+                f"INSERT INTO {table} BY NAME SELECT * FROM {{source}}",
+            )
+        except Exception:
+            self.conn.rollback()
+            raise
+        self.conn.commit()
+
+    def replace(self, table: str, data: Any) -> None:
+        """
+        Replaces the contents and schema of a table, creating it if needed.
+
+        Args:
+            table (str): Name of the table
+            data (Any): List of dicts, pandas DataFrame or Arrow table
+
+        Raises:
+            ValueError: If table name contains invalid characters
+        """
+        self._validate_table_name(table)
+        self._catalog = None
+        self._drop_samples(table)
+        self._load(
+            table, data, f"CREATE OR REPLACE TABLE {table} AS SELECT * FROM {{source}}"
+        )
+
+    def catalog(self) -> Dict[str, Dict[str, str]]:
+        """
+        Returns the column names and DuckDB types of every table and view,
+        as {table: {column: type}}. Read once and cached until ``replace`` or a statement
+        run by an executor creates, drops or alters an object.
+        """
+        if self._catalog is None:
+            catalog: Dict[str, Dict[str, str]] = {}
+            for table_name, column_name, data_type in self.conn.execute(
+                "SELECT table_name, column_name, data_type "
+                "FROM information_schema.columns "
+                "WHERE table_catalog = current_database() AND table_schema = current_schema() "
+                "ORDER BY table_name, ordinal_position"
+            ).fetchall():
+                catalog.setdefault(table_name, {})[column_name] = data_type
+            self._catalog = catalog
+        return self._catalog
+
+    def sample_table(self, table: str, rate: float, seed: int = 42) -> str:
+        """
+        Returns a deterministic Bernoulli sample of a table, building it on first use.
+        Samples live in the ``_samples`` schema and are rebuilt after the table changes.
+
+        Args:
+            table (str): Name of a seeded table or view
+            rate (float): Fraction of rows to keep, in (0, 1]
+            seed (int): Sampling seed; the same seed always selects the same rows
+
+        Returns:
+            str: Qualified name of the sample table
+
+        Raises:
+            ValueError: If the table name is invalid or rate is outside (0, 1]
+        """
+        self._validate_table_name(table)
+        if not 0 < rate <= 1:
+            raise ValueError(f"Sample rate must be in (0, 1], got {rate}.")
+        name = f"_samples.{table}_{round(rate * 1_000_000)}_{seed}"
+        if name not in self._samples.get(table, []):
+            self.conn.execute("CREATE SCHEMA IF NOT EXISTS _samples")
+            self.conn.execute(
+                f"CREATE OR REPLACE TABLE {name} AS SELECT * FROM {table} "
+                f"USING SAMPLE bernoulli({rate * 100} PERCENT) REPEATABLE ({int(seed)})"
+            )
+            self._samples.setdefault(table, []).append(name)
+        return name
+
+    def _drop_samples(self, table: str) -> None:
+        """Drops the sample tables built from a table whose data is changing."""
+        for name in self._samples.pop(table, []):
+            self.conn.execute(f"DROP TABLE IF EXISTS {name}")
+
+    def save(self, path: Union[str, os.PathLike]) -> None:
+        """
+        Copies every table and view into a DuckDB database file, which other
+        processes can open with ``DuckdbSQLSeeder(database=path, read_only=True)``.
+
+        Args:
+            path (Union[str, os.PathLike]): Target database file; it must not exist yet.
+
+        Raises:
+            ValueError: If the target file already exists
+        """
+        path = os.fspath(path)
+        if os.path.exists(path):
+            raise ValueError(f"Database file '{path}' already exists.")
+        source = self.conn.execute("SELECT current_database()").fetchone()[0]
+        self.conn.execute(f"ATTACH {_quote(path)} AS _export")
+        try:
+            quoted = source.replace('"', '""')
+            self.conn.execute(f'COPY FROM DATABASE "{quoted}" TO _export')
+        finally:
+            self.conn.execute("DETACH _export")
 
     def get_connection(self) -> duckdb.DuckDBPyConnection:
         """
         Returns the seeded duckdb connection.
         """
         return self.conn
+
+
+# json_structure() types mapped to the types the pandas path produces. Integers keep
+# their exact type, wide enough for every value, and are narrowed once loaded.
+_PANDAS_JSON_TYPES = {
+    "NULL": "INTEGER",
+    # Values of mixed types
+    "JSON": "VARCHAR",
+}
+
+
+_JSON_INTEGER_TYPES = ("BIGINT", "UBIGINT", "HUGEINT")
+_INT64_MIN, _INT64_MAX = -(2**63), 2**63 - 1
+
+
+def _pandas_json_structure(structure: Any) -> Any:
+    """Maps the types of a json_structure() result to those pandas would give."""
+    if isinstance(structure, dict):
+        return {key: _pandas_json_structure(value) for key, value in structure.items()}
+    if isinstance(structure, list):
+        return [_pandas_json_structure(value) for value in structure]
+    return _PANDAS_JSON_TYPES.get(structure, structure)
+
+
+def _quote(value: str) -> str:
+    """Quotes a string as a SQL literal."""
+    return "'" + value.replace("'", "''") + "'"
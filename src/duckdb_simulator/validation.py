@@ -0,0 +1,196 @@
+"""
+duckdb_simulator.validation
+---------------------------
+Static checks of queries against a seeded schema, without executing them.
+Used by ``DuckdbSQLExecutor.validate()`` and ``validate_many()``.
+
+A query is translated to DuckDB SQL, then qualified and type-annotated by
+sqlglot against the seeder's catalog. Reported problems are:
+
+- translation errors, including functions sqlglot cannot map to DuckDB
+- tables that are neither seeded nor defined by a CTE
+- columns that cannot be resolved
+- comparisons and arithmetic between text and numeric columns
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+from collections.abc import Iterable, Mapping
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import sqlglot
+from sqlglot import exp
+from sqlglot.errors import ErrorLevel
+from sqlglot.optimizer.annotate_types import annotate_types
+from sqlglot.optimizer.qualify import qualify
+from sqlglot.schema import MappingSchema
+
+# Batches smaller than this are validated in-process: spawning workers costs more.
+PARALLEL_THRESHOLD = 500
+
+_ARITHMETIC = (exp.Add, exp.Sub, exp.Mul, exp.Div, exp.Mod)
+_COMPARISON = (exp.EQ, exp.NEQ, exp.GT, exp.GTE, exp.LT, exp.LTE)
+
+
+@dataclass(frozen=True)
+class ValidationResult:
+    """Problems found in one query. ``ok`` is True when there are none."""
+
+    query: str
+    translated_query: str | None
+    errors: tuple[str, ...] = ()
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+
+def build_schema(catalog: Mapping[str, Mapping[str, str]]) -> MappingSchema:
+    """Convert a {table: {column: duckdb_type}} catalog to a sqlglot schema.
+
+    Types sqlglot cannot parse are kept as UNKNOWN so they never cause false errors.
+    """
+    mapping: dict[str, dict[str, str]] = {}
+    for table, columns in catalog.items():
+        mapping[table] = {}
+        for column, data_type in columns.items():
+            try:
+                exp.DataType.build(data_type, dialect="duckdb")
+            except Exception:
+                data_type = "UNKNOWN"
+            mapping[table][column] = data_type
+    return MappingSchema(mapping, dialect="duckdb")
+
+
+def _unknown_tables(expression: exp.Expression, schema: MappingSchema) -> list[str]:
+    ctes = {cte.alias_or_name.lower() for cte in expression.find_all(exp.CTE)}
+    unknown = []
+    for table in expression.find_all(exp.Table):
+        name = table.name
+        if not name or name.lower() in ctes or name in unknown:
+            continue
+        # Seeded tables live in the default schema; schema.find ignores the qualifier
+        if table.db.lower() not in ("", "main"):
+            unknown.append(f"{table.db}.{name}")
+        elif schema.find(table, raise_on_missing=False) is None:
+            unknown.append(name)
+    return unknown
+
+
+def _type_problems(expression: exp.Expression) -> list[str]:
+    problems = []
+    for node in expression.find_all(*_ARITHMETIC, *_COMPARISON):
+        # DuckDB casts literals implicitly, e.g. id = '1'; only compare two columns
+        if not (
+            isinstance(node.left, exp.Column) and isinstance(node.right, exp.Column)
+        ):
+            continue
+        left, right = node.left.type, node.right.type
+        if left is None or right is None:
+            continue
+        kinds = {left.this, right.this}
+        if kinds & exp.DataType.TEXT_TYPES and kinds & exp.DataType.NUMERIC_TYPES:
+            problems.append(
+                f"Type mismatch in '{node.sql('duckdb')}': {left.sql()} vs {right.sql()}"
+            )
+    return problems
+
+
+def validate_query(
+    query: str, read_dialect: str, schema: MappingSchema
+) -> ValidationResult:
+    """Translate, qualify and type-check a single query against ``schema``.
+
+    Args:
+        query:        SQL in the source dialect.
+        read_dialect: sqlglot dialect of ``query``.
+        schema:       Schema built by :func:`build_schema`.
+
+    Returns:
+        ValidationResult: Translated SQL and the problems found, if any.
+    """
+    try:
+        translated_query = sqlglot.transpile(
+            query,
+            read=read_dialect,
+            write="duckdb",
+            unsupported_level=ErrorLevel.RAISE,
+        )[0]
+        expression = sqlglot.parse_one(translated_query, read="duckdb")
+    except Exception as e:
+        return ValidationResult(query, None, (f"Translation failed: {e}",))
+
+    unknown = _unknown_tables(expression, schema)
+    if unknown:
+        return ValidationResult(
+            query,
+            translated_query,
+            tuple(f"Unknown table '{name}'" for name in unknown),
+        )
+
+    try:
+        qualified = qualify(
+            expression, schema=schema, dialect="duckdb", validate_qualify_columns=True
+        )
+        annotate_types(qualified, schema=schema, dialect="duckdb")
+    except Exception as e:
+        return ValidationResult(query, translated_query, (str(e),))
+    return ValidationResult(query, translated_query, tuple(_type_problems(qualified)))
+
+
+# ---------------------------------------------------------------------------
+# Batch validation — one schema per worker process
+# ---------------------------------------------------------------------------
+
+_worker_schema: MappingSchema | None = None
+_worker_dialect: str | None = None
+
+
+def _init_worker(read_dialect: str, catalog: dict[str, dict[str, str]]) -> None:
+    global _worker_schema, _worker_dialect
+    _worker_schema = build_schema(catalog)
+    _worker_dialect = read_dialect
+
+
+def _validate_in_worker(query: str) -> ValidationResult:
+    return validate_query(query, _worker_dialect, _worker_schema)
+
+
+def validate_queries(
+    queries: Iterable[str],
+    read_dialect: str,
+    catalog: Mapping[str, Mapping[str, str]],
+    *,
+    schema: MappingSchema | None = None,
+    max_workers: int | None = None,
+) -> list[ValidationResult]:
+    """Validate many queries, using a process pool for large batches.
+
+    Args:
+        queries:      SQL in the source dialect.
+        read_dialect: sqlglot dialect of the queries.
+        catalog:      {table: {column: duckdb_type}}, e.g. from ``DuckdbSQLSeeder.catalog()``.
+        schema:       Prebuilt schema for in-process validation, to skip rebuilding it.
+        max_workers:  Worker processes. 1 validates in-process. Defaults to the CPU count
+                      for batches of at least ``PARALLEL_THRESHOLD`` queries.
+
+    Returns:
+        list[ValidationResult]: One result per query, in input order.
+    """
+    queries = list(queries)
+    if max_workers == 1 or (max_workers is None and len(queries) < PARALLEL_THRESHOLD):
+        if schema is None:
+            schema = build_schema(catalog)
+        return [validate_query(query, read_dialect, schema) for query in queries]
+
+    workers = max_workers or multiprocessing.cpu_count()
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(read_dialect, {t: dict(c) for t, c in catalog.items()}),
+    ) as pool:
+        chunksize = max(1, len(queries) // (workers * 4))
+        return list(pool.map(_validate_in_worker, queries, chunksize=chunksize))
@@ -0,0 +1,107 @@
+"""
+duckdb_simulator.warmup
+-----------------------
+Background warm-up of sqlglot and DuckDB.
+
+The first query in a process pays for sqlglot's lazy dialect loading, its
+tokenizer and parser setup, and DuckDB's first-query and pandas-conversion
+setup. ``start_warmup`` moves that cost to a background thread so it overlaps
+with test collection, seeding or notebook startup, and reports how long a cold
+and a warm translate-and-execute took.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+
+import duckdb
+import sqlglot
+
+# Touches the tokenizer, parser, generator and DuckDB → pandas conversion.
+_WARMUP_QUERY = "SELECT 1 AS id, 'a' AS name WHERE 1 = 1 ORDER BY id"
+
+
+@dataclass(frozen=True)
+class WarmupReport:
+    """Latency of the first (cold) and second (warm) trivial translate-and-execute."""
+
+    dialect: str
+    cold_seconds: float
+    warm_seconds: float
+
+
+class Warmup:
+    """Handle on a warm-up running in a daemon thread."""
+
+    def __init__(
+        self, read_dialect: str, conn: duckdb.DuckDBPyConnection | None = None
+    ) -> None:
+        self.read_dialect = read_dialect
+        self._conn = conn
+        self._report: WarmupReport | None = None
+        self._error: BaseException | None = None
+        self._thread = threading.Thread(
+            target=self._run,
+            name=f"duckdb-simulator-warmup-{read_dialect}",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def _once(self, conn: duckdb.DuckDBPyConnection) -> float:
+        started = time.perf_counter()
+        sql = sqlglot.transpile(_WARMUP_QUERY, read=self.read_dialect, write="duckdb")[
+            0
+        ]
+        conn.execute(sql).fetchdf()
+        return time.perf_counter() - started
+
+    def _run(self) -> None:
+        try:
+            # A cursor is a separate connection to the same database, safe to use
+            # while the caller's thread runs queries on the original connection.
+            conn = self._conn.cursor() if self._conn is not None else duckdb.connect()
+            try:
+                cold = self._once(conn)
+                warm = self._once(conn)
+            finally:
+                conn.close()
+            dialect = getattr(self.read_dialect, "value", self.read_dialect)
+            self._report = WarmupReport(dialect, cold, warm)
+        except BaseException as e:  # reported by wait(), never raised in the thread
+            self._error = e
+
+    @property
+    def done(self) -> bool:
+        return not self._thread.is_alive()
+
+    def wait(self, timeout: float | None = None) -> WarmupReport | None:
+        """Block until the warm-up finishes and return its report.
+
+        Returns:
+            WarmupReport | None: None if the warm-up is still running after ``timeout``.
+
+        Raises:
+            Exception: Whatever the warm-up raised, e.g. an unknown dialect.
+        """
+        self._thread.join(timeout)
+        if self._error is not None:
+            raise self._error
+        return self._report
+
+
+def start_warmup(
+    read_dialect: str, conn: duckdb.DuckDBPyConnection | None = None
+) -> Warmup:
+    """Start warming up sqlglot for ``read_dialect`` and DuckDB in a background thread.
+
+    Args:
+        read_dialect: sqlglot dialect to pre-load.
+        conn:         Connection whose database to warm up. Defaults to a fresh
+                      in-memory database.
+
+    Returns:
+        Warmup: Handle whose ``wait()`` returns the cold and warm latency.
+    """
+    return Warmup(read_dialect, conn)
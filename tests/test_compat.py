@@ -0,0 +1,115 @@
+import pytest
+
+from duckdb_simulator.compat import _REGISTERED, register_compat
+from duckdb_simulator.executor import DuckdbSQLExecutor, QueryExecutionError
+from duckdb_simulator.models import Dialect
+from duckdb_simulator.seeder import DuckdbSQLSeeder
+
+
+@pytest.fixture
+def seeder():
+    return DuckdbSQLSeeder(
+        {
+            "codes": [
+                {"id": 1, "code": "AB-12", "amount": "12.5"},
+                {"id": 2, "code": "CD", "amount": "n/a"},
+                {"id": 3, "code": None, "amount": None},
+            ]
+        }
+    )
+
+
+def test_tsql_macros(seeder):
+    executor = DuckdbSQLExecutor(dialect=Dialect.AZURE_SYNAPSE, seeder=seeder)
+    df = executor.query_to_df(
+        "SELECT id, ISNUMERIC(amount) AS numeric_flag, QUOTENAME(code) AS quoted, "
+        "STR(id * 1.5, 6, 1) AS padded, CHOOSE(id, 'one', 'two') AS word "
+        "FROM codes ORDER BY id"
+    )
+    assert list(df["numeric_flag"]) == [1, 0, 0]
+    assert df["quoted"][0] == "[AB-12]"
+    assert list(df["padded"]) == ["   1.5", "   3.0", "   4.5"]
+    assert df["word"].tolist()[:2] == ["one", "two"]
+    assert df["word"].isna()[2]
+
+
+def test_tsql_patindex_is_vectorized_over_columns(seeder):
+    executor = DuckdbSQLExecutor(dialect=Dialect.TSQL, seeder=seeder)
+    df = executor.query_to_df(
+        "SELECT id, PATINDEX('%[0-9]%', code) AS first_digit, "
+        "PATINDEX('CD', code) AS exact FROM codes ORDER BY id"
+    )
+    assert df["first_digit"].tolist()[:2] == [4, 0]
+    assert df["exact"].tolist()[:2] == [0, 1]
+    assert df["first_digit"].isna()[2]
+
+
+def test_tsql_datalength_counts_string_bytes_only(seeder):
+    executor = DuckdbSQLExecutor(dialect=Dialect.TSQL, seeder=seeder)
+    df = executor.query_to_df(
+        "SELECT id, DATALENGTH(code) AS bytes FROM codes ORDER BY id"
+    )
+    assert df["bytes"].tolist()[:2] == [5, 2]
+    assert df["bytes"].isna()[2]
+    with pytest.raises(QueryExecutionError, match="strlen"):
+        executor.query_to_df("SELECT DATALENGTH(id) AS bytes FROM codes")
+
+
+def test_tsql_functions_rewritten_by_sqlglot(seeder):
+    executor = DuckdbSQLExecutor(dialect=Dialect.TSQL, seeder=seeder)
+    df = executor.query_to_df(
+        "SELECT DATEFROMPARTS(2024, 2, 10) AS made, "
+        "EOMONTH(CAST('2024-02-10' AS DATE)) AS month_end, "
+        "IIF(1 > 0, 'yes', 'no') AS flag"
+    )
+    assert str(df["made"][0].date()) == "2024-02-10"
+    assert str(df["month_end"][0].date()) == "2024-02-29"
+    assert df["flag"][0] == "yes"
+
+
+def test_snowflake_functions_rewritten_by_sqlglot(seeder):
+    executor = DuckdbSQLExecutor(dialect=Dialect.SNOWFLAKE, seeder=seeder)
+    df = executor.query_to_df(
+        "SELECT id, IFF(id > 1, 'big', 'small') AS size, DIV0(id, id - 1) AS ratio, "
+        "TRY_TO_NUMBER(amount) AS amount FROM codes ORDER BY id"
+    )
+    assert df["size"].tolist() == ["small", "big", "big"]
+    assert df["ratio"].tolist() == [0, 2, 1.5]
+    assert df["amount"].tolist()[0] == 13
+    assert df["amount"].isna().tolist()[1:] == [True, True]
+
+
+def test_snowflake_macros(seeder):
+    executor = DuckdbSQLExecutor(dialect=Dialect.SNOWFLAKE, seeder=seeder)
+    df = executor.query_to_df(
+        "SELECT HAVERSINE(40.7127, -74.0059, 34.0500, -118.2500) AS km, "
+        "TRY_BASE64_DECODE_STRING('QQ==') AS decoded, "
+        "TRY_BASE64_DECODE_STRING('!!') AS invalid"
+    )
+    assert df["km"][0] == pytest.approx(3936.385096389)
+    assert df["decoded"][0] == "A"
+    assert df["invalid"].isna()[0]
+
+
+def test_compat_can_be_disabled(seeder):
+    executor = DuckdbSQLExecutor(dialect=Dialect.TSQL, seeder=seeder, compat=False)
+    assert executor.compat_functions == []
+    with pytest.raises(QueryExecutionError, match="isnumeric"):
+        executor.query_to_df("SELECT ISNUMERIC('1') AS n")
+
+
+def test_register_compat_is_idempotent(seeder):
+    conn = seeder.get_connection()
+    first = register_compat(conn, "tsql")
+    assert "patindex" in first
+    assert register_compat(conn, "tsql") == first
+    assert register_compat(conn, "duckdb") == []
+    assert conn.execute("SELECT PATINDEX('%b%', 'abc')").fetchone() == (2,)
+
+
+def test_compat_registered_once_per_connection(seeder):
+    first = DuckdbSQLExecutor(dialect=Dialect.TSQL, seeder=seeder)
+    assert _REGISTERED[seeder.get_connection()]["tsql"] == first.compat_functions
+    second = DuckdbSQLExecutor(dialect=Dialect.TSQL, seeder=seeder)
+    assert second.compat_functions == first.compat_functions
+    assert second.query_to_df("SELECT ISNUMERIC('1') AS n")["n"][0] == 1
@@ -0,0 +1,147 @@
+import threading
+
+import pytest
+
+from duckdb_simulator.daemon import DaemonError, DaemonSQLExecutor, SimulatorDaemon
+from duckdb_simulator.executor import (
+    DuckdbSQLExecutor,
+    QueryExecutionError,
+    QueryTimeoutError,
+    QueryTranslationError,
+)
+from duckdb_simulator.models import Dialect
+from duckdb_simulator.protocols import SQLExecutor
+from duckdb_simulator.seeder import DuckdbSQLSeeder
+
+
+@pytest.fixture
+def daemon(tmp_path):
+    server = SimulatorDaemon(str(tmp_path / "simulator.sock"))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_daemon_query_matches_local_executor(daemon):
+    query = "SELECT TOP 3 id, country, amount FROM orders ORDER BY amount DESC"
+    with DaemonSQLExecutor(
+        Dialect.AZURE_SYNAPSE, "orders", socket_path=daemon.socket_path
+    ) as client:
+        assert isinstance(client, SQLExecutor)
+        df = client.query_to_df(query)
+        assert client.last_stats.rows == 3
+        assert "LIMIT 3" in client.last_stats.translated_query
+        assert client.ping() == ["orders"]
+
+    local = DuckdbSQLExecutor(
+        dialect=Dialect.AZURE_SYNAPSE, seeder=DuckdbSQLSeeder.from_dataset("orders")
+    )
+    expected = local.query_to_df(query)
+    assert df.equals(expected)
+
+
+def test_daemon_shares_databases_and_translations(daemon):
+    query = "SELECT COUNT(*) AS n FROM users"
+    for _ in range(2):
+        with DaemonSQLExecutor(
+            Dialect.POSTGRES, "full", socket_path=daemon.socket_path
+        ) as client:
+            assert client.query_to_df(query)["n"][0] == 6
+    executor = daemon._databases["full"].executors["postgres"]
+    assert executor._transpile.cache_info().hits == 1
+
+
+def test_daemon_cache_hits_keep_per_call_bookkeeping(daemon):
+    with DaemonSQLExecutor(
+        Dialect.DUCKDB, "orders", socket_path=daemon.socket_path
+    ) as client:
+        for _ in range(2):
+            client.query_to_df("CREATE TABLE copied AS SELECT * FROM orders")
+            executor = daemon._databases["orders"].executors["duckdb"]
+            assert "copied" in executor.seeder.catalog()
+            client.query_to_df("DROP TABLE copied")
+            assert "copied" not in executor.seeder.catalog()
+    assert executor._transpile.cache_info().hits == 2
+
+
+def test_daemon_results_keep_local_dtypes(daemon):
+    query = (
+        "SELECT id, CAST(amount AS DECIMAL(10, 2)) AS amount, "
+        "CAST('2024-01-05' AS DATE) AS day, CAST(NULL AS INTEGER) AS missing, "
+        "id > 2 AS flag, CAST('6d2ab7f4-371d-4d50-a5dd-0624dc1f6f31' AS UUID) AS uid "
+        "FROM orders ORDER BY id"
+    )
+    with DaemonSQLExecutor(
+        Dialect.DUCKDB, "orders", socket_path=daemon.socket_path
+    ) as client:
+        df = client.query_to_df(query)
+    local = DuckdbSQLExecutor(
+        dialect=Dialect.DUCKDB, seeder=DuckdbSQLSeeder.from_dataset("orders")
+    )
+    expected = local.query_to_df(query)
+    assert df.dtypes.equals(expected.dtypes)
+    assert df.equals(expected)
+
+
+def test_daemon_pre_and_post_queries(daemon):
+    with DaemonSQLExecutor(
+        Dialect.DUCKDB, "orders", socket_path=daemon.socket_path
+    ) as client:
+        df = client.query_to_df(
+            "SELECT COUNT(*) AS n FROM big_orders",
+            pre_queries=[
+                "CREATE TEMP TABLE big_orders AS SELECT * FROM orders WHERE amount > 100"
+            ],
+            post_queries=["DROP TABLE big_orders"],
+        )
+        assert df["n"][0] > 0
+
+
+def test_daemon_reraises_query_errors(daemon):
+    with DaemonSQLExecutor(
+        Dialect.DUCKDB, "orders", socket_path=daemon.socket_path
+    ) as client:
+        with pytest.raises(QueryExecutionError, match="nonexistent_table"):
+            client.query_to_df("SELECT * FROM nonexistent_table")
+        with pytest.raises(QueryTranslationError):
+            client.query_to_df("SELECT * FROM (")
+        with pytest.raises(QueryTimeoutError) as info:
+            client.query_to_df(
+                "SELECT COUNT(*) FROM range(100000000) a, range(100000) b",
+                timeout=0.2,
+            )
+        assert info.value.timeout == 0.2
+        assert info.value.execute_seconds >= 0.2
+        # The connection is still usable after errors
+        assert len(client.query_to_df("SELECT * FROM orders")) == 10
+
+
+def test_daemon_unknown_source(daemon):
+    with DaemonSQLExecutor(
+        Dialect.DUCKDB, "no_such_dataset", socket_path=daemon.socket_path
+    ) as client:
+        with pytest.raises(DaemonError, match="ValueError"):
+            client.query_to_df("SELECT 1")
+
+
+def test_daemon_serves_database_files(daemon, tmp_path):
+    path = str(tmp_path / "fixture.duckdb")
+    DuckdbSQLSeeder({"t": [{"id": 1}, {"id": 2}]}).save(path)
+    with DaemonSQLExecutor(
+        Dialect.DUCKDB, path, socket_path=daemon.socket_path
+    ) as client:
+        assert client.query_to_df("SELECT SUM(id) AS s FROM t")["s"][0] == 3
+
+
+def test_daemon_client_without_daemon(tmp_path):
+    with pytest.raises(DaemonError, match="No duckdb-simulator daemon"):
+        DaemonSQLExecutor(
+            Dialect.DUCKDB, "orders", socket_path=str(tmp_path / "missing.sock")
+        )
+
+
+def test_daemon_refuses_second_server(daemon, tmp_path):
+    with pytest.raises(DaemonError, match="already listening"):
+        SimulatorDaemon(daemon.socket_path)
@@ -0,0 +1,81 @@
+import pytest
+
+from duckdb_simulator import fixtures
+from duckdb_simulator.equivalence import EquivalenceCase, run_equivalence
+from duckdb_simulator.executor import DuckdbSQLExecutor
+from duckdb_simulator.models import Dialect
+from duckdb_simulator.seeder import DuckdbSQLSeeder
+
+
+@pytest.fixture(scope="module")
+def full_database(tmp_path_factory):
+    path = tmp_path_factory.mktemp("equivalence") / "full.duckdb"
+    DuckdbSQLSeeder(fixtures.FULL).save(path)
+    return path
+
+
+def test_saved_database_opens_read_only(full_database):
+    seeder = DuckdbSQLSeeder(database=str(full_database), read_only=True)
+    executor = DuckdbSQLExecutor(dialect=Dialect.DUCKDB, seeder=seeder)
+    assert executor.query_to_df("SELECT COUNT(*) AS n FROM orders").iloc[0]["n"] == 10
+    with pytest.raises(Exception, match="read-only"):
+        seeder.get_connection().execute("DELETE FROM orders")
+
+
+def test_read_only_seeder_rejects_config(full_database):
+    with pytest.raises(ValueError, match="read-only"):
+        DuckdbSQLSeeder(fixtures.ORDERS, database=str(full_database), read_only=True)
+
+
+def test_save_refuses_to_overwrite(full_database):
+    with pytest.raises(ValueError, match="already exists"):
+        DuckdbSQLSeeder(fixtures.ORDERS).save(full_database)
+
+
+def test_run_equivalence_reports_matches_and_mismatches(full_database):
+    cases = [
+        EquivalenceCase(
+            "top_order",
+            {
+                Dialect.TSQL: "SELECT TOP 1 id FROM orders ORDER BY amount DESC",
+                Dialect.SNOWFLAKE: "SELECT id FROM orders ORDER BY amount DESC LIMIT 1",
+                Dialect.BIGQUERY: "SELECT id FROM orders ORDER BY amount DESC LIMIT 1",
+            },
+        ),
+        EquivalenceCase(
+            "revenue_by_country",
+            {
+                Dialect.TSQL: "SELECT country, SUM(amount) AS r FROM orders GROUP BY country",
+                Dialect.SNOWFLAKE: "SELECT country, SUM(amount) FROM orders GROUP BY 1",
+            },
+        ),
+        EquivalenceCase(
+            "wrong_filter",
+            {
+                Dialect.TSQL: "SELECT COUNT(*) FROM orders WHERE country = 'FR'",
+                Dialect.SNOWFLAKE: "SELECT COUNT(*) FROM orders WHERE country = 'DE'",
+            },
+        ),
+        EquivalenceCase(
+            "broken",
+            {
+                Dialect.TSQL: "SELECT COUNT(*) FROM orders",
+                Dialect.BIGQUERY: "SELECT COUNT(*) FROM missing_table",
+            },
+        ),
+    ]
+    report = run_equivalence(cases, database=full_database, max_workers=2)
+
+    assert [case.name for case in report.mismatches] == ["wrong_filter", "broken"]
+    assert "QueryExecutionError" in report.cases[3].mismatches["bigquery"]
+    broken = report.cases[3].runs["bigquery"]
+    assert broken.translated_query == "SELECT COUNT(*) FROM missing_table"
+    assert broken.translate_seconds > 0
+    assert report.cases[0].runs["tsql"].translated_query.endswith("LIMIT 1")
+    assert set(report.translation_cost()) == {"tsql", "snowflake", "bigquery"}
+    assert "2/4 cases equivalent" in report.summary()
+
+
+def test_run_equivalence_missing_database(tmp_path):
+    with pytest.raises(ValueError, match="does not exist"):
+        run_equivalence([], database=tmp_path / "missing.duckdb")
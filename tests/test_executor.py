@@ -1,8 +1,15 @@
+import os
+import threading
+import time
+
+import pandas as pd
 import pytest
 
 from duckdb_simulator.executor import (
     DuckdbSQLExecutor,
+    QueryCancelledError,
     QueryExecutionError,
+    QueryTimeoutError,
     QueryTranslationError,
 )
 from duckdb_simulator.models import Dialect
@@ -91,3 +98,441 @@ def test_executor_exception_chaining(mock_seeder):
     with pytest.raises(QueryExecutionError) as exc_info:
         executor.query_to_df("SELECT * FROM nonexistent")
     assert exc_info.value.__cause__ is not None
+
+
+def test_executor_execution_error_carries_translation(mock_seeder):
+    executor = DuckdbSQLExecutor(dialect=Dialect.TSQL, seeder=mock_seeder)
+    with pytest.raises(QueryExecutionError) as exc_info:
+        executor.query_to_df("SELECT TOP 1 * FROM nonexistent")
+    error = exc_info.value
+    assert error.query == "SELECT TOP 1 * FROM nonexistent"
+    assert error.translated_query == "SELECT * FROM nonexistent LIMIT 1"
+    assert error.translate_seconds > 0
+    assert error.execute_seconds >= 0
+
+
+def test_executor_query_to_arrow(mock_seeder):
+    executor = DuckdbSQLExecutor(dialect=Dialect.TSQL, seeder=mock_seeder)
+    table = executor.query_to_arrow(
+        "SELECT TOP 2 name FROM employees ORDER BY salary DESC"
+    )
+    assert table.column("name").to_pylist() == ["Charlie", "Bob"]
+    assert executor.last_stats.rows == 2
+
+
+def test_executor_records_query_stats(mock_seeder):
+    executor = DuckdbSQLExecutor(dialect=Dialect.TSQL, seeder=mock_seeder)
+    assert executor.last_stats is None
+    executor.query_to_df("SELECT TOP 2 * FROM employees")
+    stats = executor.last_stats
+    assert stats.query == "SELECT TOP 2 * FROM employees"
+    assert "LIMIT 2" in stats.translated_query
+    assert stats.rows == 2
+    assert stats.total_seconds >= stats.execute_seconds
+
+
+# Hash aggregate over millions of groups: hundreds of MB of buffer memory
+_LARGE_QUERY = (
+    "SELECT range % 3000000 AS g, COUNT(*) AS n FROM range(6000000) GROUP BY g"
+)
+
+
+def test_executor_peak_memory_is_per_query(mock_seeder):
+    executor = DuckdbSQLExecutor(
+        dialect=Dialect.DUCKDB, seeder=mock_seeder, track_memory=True
+    )
+    executor.query_to_df(_LARGE_QUERY)
+    large = executor.last_stats.peak_memory_bytes
+    executor.query_to_df("SELECT * FROM employees")
+    small = executor.last_stats.peak_memory_bytes
+    assert small is not None
+    assert small < large
+    assert executor.profile("SELECT * FROM employees").peak_memory_bytes < large
+
+
+def test_executor_memory_not_tracked_by_default(mock_seeder):
+    executor = DuckdbSQLExecutor(dialect=Dialect.DUCKDB, seeder=mock_seeder)
+    executor.query_to_df("SELECT * FROM employees")
+    assert executor.last_stats.peak_memory_bytes is None
+    assert executor.last_stats.peak_temp_bytes is None
+    assert executor.profile("SELECT * FROM employees").peak_memory_bytes is None
+
+
+def test_executor_peak_temp_is_per_query(tmp_path):
+    seeder = DuckdbSQLSeeder(
+        {"t": [{"id": 1}]},
+        threads=1,
+        memory_limit="64MB",
+        temp_directory=str(tmp_path),
+    )
+    executor = DuckdbSQLExecutor(
+        dialect=Dialect.DUCKDB, seeder=seeder, track_memory=True
+    )
+    executor.query_to_df(_LARGE_QUERY + " ORDER BY n DESC, g LIMIT 1")
+    spilled = executor.last_stats.peak_temp_bytes
+    executor.query_to_df("SELECT * FROM t")
+    assert spilled > 0
+    assert executor.last_stats.peak_temp_bytes < spilled
+
+
+def test_executor_profile_returns_operator_tree(mock_seeder):
+    executor = DuckdbSQLExecutor(dialect=Dialect.TSQL, seeder=mock_seeder)
+    profile = executor.profile(
+        "SELECT dept_id, COUNT(*) AS n FROM employees GROUP BY dept_id"
+    )
+    names = [op.name for op in profile.walk()]
+    assert "EXPLAIN_ANALYZE" not in names
+    assert any("GROUP_BY" in name for name in names)
+    scan = next(op for op in profile.walk() if "SCAN" in op.name)
+    assert scan.cardinality == 3
+    assert profile.latency_seconds is not None
+    assert "GROUP_BY" in profile.render()
+
+
+def test_executor_profile_invalid_table(mock_seeder):
+    executor = DuckdbSQLExecutor(dialect=Dialect.POSTGRES, seeder=mock_seeder)
+    with pytest.raises(QueryExecutionError):
+        executor.profile("SELECT * FROM nonexistent")
+
+
+def test_executor_slow_query_log(mock_seeder, caplog):
+    executor = DuckdbSQLExecutor(
+        dialect=Dialect.TSQL, seeder=mock_seeder, slow_query_threshold=0.0
+    )
+    executor.query_to_df("SELECT TOP 1 name FROM employees")
+    assert len(executor.slow_queries) == 1
+    entry = executor.slow_queries[0]
+    assert entry.query == "SELECT TOP 1 name FROM employees"
+    assert "LIMIT 1" in entry.translated_query
+    assert any("SCAN" in op.name for op in entry.profile.walk())
+    assert "Slow query" in caplog.text
+
+
+def test_executor_slow_query_log_disabled_by_default(mock_seeder):
+    executor = DuckdbSQLExecutor(dialect=Dialect.TSQL, seeder=mock_seeder)
+    executor.query_to_df("SELECT * FROM employees")
+    assert executor.slow_queries == []
+
+
+def test_executor_validate_valid_query(mock_seeder):
+    executor = DuckdbSQLExecutor(dialect=Dialect.TSQL, seeder=mock_seeder)
+    result = executor.validate(
+        "SELECT TOP 1 e.name, d.name FROM employees e JOIN departments d ON e.dept_id = d.id"
+    )
+    assert result.ok, result.errors
+    assert "LIMIT 1" in result.translated_query
+
+
+def test_executor_validate_reports_problems(mock_seeder):
+    executor = DuckdbSQLExecutor(dialect=Dialect.POSTGRES, seeder=mock_seeder)
+    assert executor.validate("SELECT * FROM nonexistent").errors == (
+        "Unknown table 'nonexistent'",
+    )
+    assert "bonus" in executor.validate("SELECT bonus FROM employees").errors[0]
+    assert (
+        "Type mismatch"
+        in executor.validate("SELECT * FROM employees WHERE name = salary").errors[0]
+    )
+    assert "Translation failed" in executor.validate("SELECT FROM WHERE").errors[0]
+
+
+def test_executor_validate_accepts_implicitly_cast_literals(mock_seeder):
+    executor = DuckdbSQLExecutor(dialect=Dialect.POSTGRES, seeder=mock_seeder)
+    for query in (
+        "SELECT * FROM employees WHERE id = '1'",
+        "SELECT salary + '1' AS s FROM employees",
+    ):
+        assert executor.validate(query).ok
+        executor.query_to_df(query)
+
+
+def test_executor_validate_rejects_other_schemas(mock_seeder):
+    executor = DuckdbSQLExecutor(dialect=Dialect.TSQL, seeder=mock_seeder)
+    assert executor.validate("SELECT * FROM dbo.employees").errors == (
+        "Unknown table 'dbo.employees'",
+    )
+    assert executor.validate("SELECT * FROM main.employees").ok
+    with pytest.raises(QueryExecutionError, match="dbo"):
+        executor.query_to_df("SELECT * FROM dbo.employees")
+
+
+def test_executor_validate_sees_replaced_schema(mock_seeder):
+    executor = DuckdbSQLExecutor(dialect=Dialect.POSTGRES, seeder=mock_seeder)
+    assert not executor.validate("SELECT bonus FROM employees").ok
+    mock_seeder.replace("employees", [{"id": 1, "bonus": 10}])
+    assert executor.validate("SELECT bonus FROM employees").ok
+
+
+def test_executor_validate_sees_tables_created_by_queries(mock_seeder):
+    executor = DuckdbSQLExecutor(dialect=Dialect.POSTGRES, seeder=mock_seeder)
+    assert not executor.validate("SELECT a FROM newt").ok
+    executor.query_to_df("CREATE TABLE newt AS SELECT 1 AS a")
+    assert executor.validate("SELECT a FROM newt").ok
+    executor.query_to_df(
+        "SELECT 1 AS done", pre_queries=["ALTER TABLE newt ADD COLUMN b INTEGER"]
+    )
+    assert executor.validate("SELECT b FROM newt").ok
+    executor.query_to_df("DROP TABLE newt")
+    assert not executor.validate("SELECT a FROM newt").ok
+
+
+def test_executor_validate_many_in_process_pool(mock_seeder):
+    executor = DuckdbSQLExecutor(dialect=Dialect.POSTGRES, seeder=mock_seeder)
+    queries = ["SELECT id FROM employees", "SELECT missing FROM employees"] * 3
+    results = executor.validate_many(queries, max_workers=2)
+    assert [r.ok for r in results] == [True, False] * 3
+    assert results == executor.validate_many(queries, max_workers=1)
+
+
+@pytest.fixture
+def big_seeder():
+    return DuckdbSQLSeeder({"big": pd.DataFrame({"id": range(10_000)})})
+
+
+def test_executor_sampled_mode(big_seeder):
+    executor = DuckdbSQLExecutor(
+        dialect=Dialect.TSQL, seeder=big_seeder, sample_rate=0.1
+    )
+    df = executor.query_to_df("SELECT COUNT(*) AS n FROM big")
+    assert 800 < df.iloc[0]["n"] < 1200
+    assert df.attrs["sample_rate"] == 0.1
+    assert df.attrs["estimated_full_seconds"] >= executor.last_stats.total_seconds
+    assert "_samples." in executor.last_stats.translated_query
+
+    other = DuckdbSQLExecutor(
+        dialect=Dialect.TSQL,
+        seeder=DuckdbSQLSeeder({"big": big_seeder.conn.table("big").df()}),
+        sample_rate=0.1,
+    )
+    assert other.query_to_df("SELECT COUNT(*) AS n FROM big").iloc[0]["n"] == (
+        df.iloc[0]["n"]
+    )
+
+
+def test_executor_sampled_mode_keeps_aliases_and_ctes(big_seeder):
+    executor = DuckdbSQLExecutor(
+        dialect=Dialect.POSTGRES, seeder=big_seeder, sample_rate=0.5
+    )
+    df = executor.query_to_df("""
+        WITH big_ids AS (SELECT big.id FROM big)
+        SELECT COUNT(*) AS n FROM big_ids b JOIN big ON b.id = big.id
+    """)
+    sampled = executor.query_to_df("SELECT COUNT(*) AS n FROM big")
+    assert df.iloc[0]["n"] == sampled.iloc[0]["n"]
+
+
+def test_executor_sample_rebuilt_after_append(big_seeder):
+    executor = DuckdbSQLExecutor(
+        dialect=Dialect.DUCKDB, seeder=big_seeder, sample_rate=1.0
+    )
+    assert executor.query_to_df("SELECT COUNT(*) AS n FROM big").iloc[0]["n"] == 10_000
+    big_seeder.append("big", [{"id": -1}])
+    assert executor.query_to_df("SELECT COUNT(*) AS n FROM big").iloc[0]["n"] == 10_001
+
+
+def test_executor_sampled_mode_writes_to_real_tables(big_seeder):
+    executor = DuckdbSQLExecutor(
+        dialect=Dialect.TSQL, seeder=big_seeder, sample_rate=1.0
+    )
+    assert executor.query_to_df("SELECT COUNT(*) AS n FROM big").iloc[0]["n"] == 10_000
+    df = executor.query_to_df(
+        "SELECT COUNT(*) AS n FROM big", pre_queries=["INSERT INTO big VALUES (-1)"]
+    )
+    assert df.iloc[0]["n"] == 10_001
+    assert big_seeder.conn.execute("SELECT COUNT(*) FROM big").fetchone()[0] == 10_001
+    assert executor.query_to_df("SELECT COUNT(*) AS n FROM big").iloc[0]["n"] == 10_001
+
+    executor.query_to_df("DELETE FROM big WHERE id < 0")
+    assert executor.query_to_df("SELECT COUNT(*) AS n FROM big").iloc[0]["n"] == 10_000
+
+
+def test_executor_sampled_main_query_sees_pre_query_changes(big_seeder):
+    executor = DuckdbSQLExecutor(
+        dialect=Dialect.TSQL, seeder=big_seeder, sample_rate=0.1
+    )
+    before = executor.query_to_df("SELECT COUNT(*) AS n FROM big").iloc[0]["n"]
+    df = executor.query_to_df(
+        "SELECT COUNT(*) AS n FROM big", pre_queries=["DELETE FROM big WHERE id < 5000"]
+    )
+    assert 400 < df.iloc[0]["n"] < 600
+    assert df.iloc[0]["n"] < before
+
+    # A failed batch rolls the rebuilt sample back with the pre-query
+    with pytest.raises(QueryExecutionError):
+        executor.query_to_df(
+            "SELECT missing FROM big", pre_queries=["DELETE FROM big WHERE id < 9000"]
+        )
+    after = executor.query_to_df("SELECT COUNT(*) AS n FROM big").iloc[0]["n"]
+    assert after == df.iloc[0]["n"]
+
+
+def test_executor_sample_build_not_counted_as_translation(big_seeder):
+    executor = DuckdbSQLExecutor(
+        dialect=Dialect.DUCKDB, seeder=big_seeder, sample_rate=0.1
+    )
+    executor.query_to_df("SELECT COUNT(*) AS n FROM big")
+    first = executor.last_stats
+    assert first.sample_build_seconds > 0
+    executor.query_to_df("SELECT COUNT(*) AS n FROM big")
+    assert executor.last_stats.sample_build_seconds < first.sample_build_seconds
+
+
+def test_executor_invalid_sample_rate(big_seeder):
+    with pytest.raises(ValueError, match="sample_rate"):
+        DuckdbSQLExecutor(dialect=Dialect.DUCKDB, seeder=big_seeder, sample_rate=2)
+
+
+def test_executor_pre_and_post_queries(mock_seeder):
+    executor = DuckdbSQLExecutor(dialect=Dialect.TSQL, seeder=mock_seeder)
+    df = executor.query_to_df(
+        "SELECT TOP 1 name FROM #high_earners ORDER BY salary DESC",
+        pre_queries=[
+            "SELECT name, salary INTO #high_earners FROM employees WHERE salary > 55000;"
+        ],
+        post_queries=["DROP TABLE #high_earners"],
+    )
+    assert list(df["name"]) == ["Charlie"]
+    assert "LIMIT 1" in executor.last_stats.translated_query
+    with pytest.raises(QueryExecutionError):
+        executor.query_to_df("SELECT * FROM high_earners")
+
+
+def test_executor_pre_queries_rolled_back_on_failure(mock_seeder):
+    executor = DuckdbSQLExecutor(dialect=Dialect.POSTGRES, seeder=mock_seeder)
+    with pytest.raises(QueryExecutionError, match="nonexistent"):
+        executor.query_to_df(
+            "SELECT * FROM nonexistent",
+            pre_queries=["DELETE FROM employees"],
+        )
+    assert executor.query_to_df("SELECT COUNT(*) AS n FROM employees").iloc[0]["n"] == 3
+
+
+def test_executor_post_query_failure_rolls_back(mock_seeder):
+    executor = DuckdbSQLExecutor(dialect=Dialect.POSTGRES, seeder=mock_seeder)
+    with pytest.raises(QueryExecutionError):
+        executor.query_to_df(
+            "SELECT COUNT(*) FROM employees",
+            pre_queries=["DELETE FROM employees WHERE id = 1"],
+            post_queries=["SELECT * FROM nonexistent"],
+        )
+    assert executor.query_to_df("SELECT COUNT(*) AS n FROM employees").iloc[0]["n"] == 3
+
+
+def test_executor_pre_queries_must_be_single_statements(mock_seeder):
+    executor = DuckdbSQLExecutor(dialect=Dialect.POSTGRES, seeder=mock_seeder)
+    with pytest.raises(QueryTranslationError, match="exactly one statement"):
+        executor.query_to_df(
+            "SELECT 1", pre_queries=["SET threads = 1; SET threads = 2"]
+        )
+
+
+# Runs for minutes unless interrupted
+_ENDLESS_QUERY = "SELECT COUNT(*) FROM range(100000000) a, range(100000) b"
+
+
+def test_executor_timeout_interrupts_query(mock_seeder):
+    executor = DuckdbSQLExecutor(
+        dialect=Dialect.DUCKDB, seeder=mock_seeder, timeout=0.2
+    )
+    started = time.perf_counter()
+    with pytest.raises(QueryTimeoutError) as info:
+        executor.query_to_df(_ENDLESS_QUERY)
+    assert time.perf_counter() - started < 5
+    assert not isinstance(info.value, QueryExecutionError)
+    assert info.value.timeout == 0.2
+    assert info.value.execute_seconds >= 0.2
+    assert info.value.translate_seconds >= 0
+    assert info.value.query == _ENDLESS_QUERY
+    assert "RANGE" in info.value.translated_query
+    # The connection stays usable afterwards
+    assert executor.query_to_df("SELECT COUNT(*) AS n FROM employees")["n"][0] == 3
+
+
+def test_executor_per_call_timeout_overrides_default(mock_seeder):
+    executor = DuckdbSQLExecutor(dialect=Dialect.DUCKDB, seeder=mock_seeder)
+    with pytest.raises(QueryTimeoutError):
+        executor.query_to_df(_ENDLESS_QUERY, timeout=0.2)
+    df = executor.query_to_df("SELECT * FROM employees", timeout=30)
+    assert len(df) == 3
+
+
+def test_executor_timeout_rolls_back_batch(mock_seeder):
+    executor = DuckdbSQLExecutor(dialect=Dialect.DUCKDB, seeder=mock_seeder)
+    with pytest.raises(QueryTimeoutError):
+        executor.query_to_df(
+            _ENDLESS_QUERY,
+            pre_queries=["INSERT INTO departments VALUES (3, 'Sales')"],
+            timeout=0.2,
+        )
+    df = executor.query_to_df("SELECT * FROM departments")
+    assert len(df) == 2
+
+
+def test_executor_cancel(mock_seeder):
+    executor = DuckdbSQLExecutor(dialect=Dialect.DUCKDB, seeder=mock_seeder)
+    assert executor.cancel() is False
+
+    cancelled = []
+    canceller = threading.Timer(0.2, lambda: cancelled.append(executor.cancel()))
+    canceller.start()
+    with pytest.raises(QueryCancelledError):
+        executor.query_to_df(_ENDLESS_QUERY)
+    canceller.join()
+    assert cancelled == [True]
+    assert len(executor.query_to_df("SELECT * FROM employees")) == 3
+
+
+def test_executor_invalid_timeout(mock_seeder):
+    with pytest.raises(ValueError, match="timeout"):
+        DuckdbSQLExecutor(dialect=Dialect.DUCKDB, seeder=mock_seeder, timeout=0)
+
+
+def test_executor_query_to_file_parquet(mock_seeder, tmp_path):
+    executor = DuckdbSQLExecutor(dialect=Dialect.AZURE_SYNAPSE, seeder=mock_seeder)
+    path = str(tmp_path / "top.parquet")
+    result = executor.query_to_file(
+        "SELECT TOP 2 name, salary FROM employees ORDER BY salary DESC",
+        path,
+        compression="zstd",
+        row_group_size=1,
+    )
+    assert result.rows == 2
+    assert result.files == (path,)
+    assert result.bytes_written == (tmp_path / "top.parquet").stat().st_size > 0
+    assert executor.last_stats is result.stats
+    assert result.stats.rows == 2
+    exported = mock_seeder.get_connection().execute(
+        f"SELECT name FROM read_parquet('{path}')"
+    )
+    assert [row[0] for row in exported.fetchall()] == ["Charlie", "Bob"]
+
+
+def test_executor_query_to_file_partitioned_csv(mock_seeder, tmp_path):
+    executor = DuckdbSQLExecutor(dialect=Dialect.DUCKDB, seeder=mock_seeder)
+    result = executor.query_to_file(
+        "SELECT * FROM employees",
+        str(tmp_path / "by_dept"),
+        format="csv",
+        compression="gzip",
+        partition_by=["dept_id"],
+    )
+    assert result.rows == 3
+    assert len(result.files) == 2
+    assert all(file.endswith(".csv.gz") for file in result.files)
+    assert {os.path.basename(os.path.dirname(f)) for f in result.files} == {
+        "dept_id=1",
+        "dept_id=2",
+    }
+    assert result.bytes_written == sum(os.path.getsize(f) for f in result.files)
+
+
+def test_executor_query_to_file_rejects_bad_options(mock_seeder, tmp_path):
+    executor = DuckdbSQLExecutor(dialect=Dialect.DUCKDB, seeder=mock_seeder)
+    with pytest.raises(ValueError, match="format"):
+        executor.query_to_file("SELECT 1", str(tmp_path / "x.json"), format="json")
+    with pytest.raises(ValueError, match="row_group_size"):
+        executor.query_to_file(
+            "SELECT 1", str(tmp_path / "x.csv"), format="csv", row_group_size=10
+        )
+    with pytest.raises(QueryExecutionError, match="nonexistent_table"):
+        executor.query_to_file("SELECT * FROM nonexistent_table", str(tmp_path / "y"))
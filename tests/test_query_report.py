@@ -0,0 +1,96 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from duckdb_simulator.models import QueryStats
+from duckdb_simulator.profiling import QueryRecorder, fingerprint
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+
+
+def _stats(query, translate=0.01, execute=0.02):
+    return QueryStats(
+        query=query,
+        translated_query=query,
+        translate_seconds=translate,
+        execute_seconds=execute,
+        rows=1,
+    )
+
+
+def test_fingerprint_strips_literals():
+    assert fingerprint("SELECT * FROM t WHERE id = 1 AND name = 'a'") == fingerprint(
+        "select *  from T where ID = 42 and NAME = 'b'"
+    )
+    assert "?" in fingerprint("SELECT * FROM t WHERE x > -5")
+
+
+def test_fingerprint_collapses_in_lists():
+    assert fingerprint("SELECT * FROM t WHERE id IN (1, 2, 3)") == fingerprint(
+        "SELECT * FROM t WHERE id IN (7)"
+    )
+
+
+def test_fingerprint_uses_source_dialect():
+    assert fingerprint("SELECT TOP 5 a FROM t", "tsql") == fingerprint(
+        "SELECT TOP 10 a FROM t", "tsql"
+    )
+
+
+def test_fingerprint_unparseable_query():
+    assert fingerprint("SELECT   FROM WHERE") == "SELECT FROM WHERE"
+
+
+def test_query_recorder_aggregates_by_fingerprint():
+    recorder = QueryRecorder()
+    first = recorder.listener("duckdb", "test_a")
+    second = recorder.listener("duckdb", "test_b")
+    first(_stats("SELECT * FROM t WHERE id = 1"))
+    first(_stats("SELECT * FROM t WHERE id = 2"))
+    second(_stats("SELECT * FROM t WHERE id = 3"))
+    second(_stats("SELECT COUNT(*) FROM u", execute=1.0))
+
+    summary = recorder.summary()
+    assert len(recorder) == 4
+    assert [entry.calls for entry in summary] == [1, 3]
+    assert summary[1].tests == ["test_a", "test_b"]
+    assert summary[1].translate_seconds == 0.03
+    assert summary[0].to_dict()["execute_seconds"] == 1.0
+
+
+def test_pytest_session_report(tmp_path):
+    (tmp_path / "conftest.py").write_text(
+        'pytest_plugins = ["duckdb_simulator.pytest_plugin"]\n'
+    )
+    (tmp_path / "test_sample.py").write_text(
+        "def test_count(orders_executor):\n"
+        "    for country in ('FR', 'US', 'DE'):\n"
+        "        orders_executor.query_to_df(\n"
+        "            f\"SELECT COUNT(*) FROM orders WHERE country = '{country}'\"\n"
+        "        )\n"
+    )
+    report_path = tmp_path / "report.json"
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "pytest",
+            "-p",
+            "no:cacheprovider",
+            "--duckdb-report",
+            f"--duckdb-report-json={report_path}",
+        ],
+        cwd=tmp_path,
+        env={**os.environ, "PYTHONPATH": str(SRC)},
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert "duckdb-simulator query report" in result.stdout
+    assert "3 queries, 1 fingerprints" in result.stdout
+
+    report = json.loads(report_path.read_text())
+    assert report[0]["calls"] == 3
+    assert report[0]["tests"] == ["test_sample.py::test_count"]
@@ -0,0 +1,70 @@
+import pyarrow as pa
+import pytest
+
+from duckdb_simulator import fixtures, registry
+from duckdb_simulator.executor import DuckdbSQLExecutor
+from duckdb_simulator.models import Dialect
+from duckdb_simulator.seeder import DuckdbSQLSeeder
+
+
+@pytest.fixture
+def sales_dataset():
+    data = {"sales": [{"id": 1, "amount": 10.0}, {"id": 2, "amount": None}]}
+    registry.register_dataset("sales", data)
+    yield data
+    registry.unregister_dataset("sales")
+
+
+def test_builtin_datasets_registered():
+    assert {"orders", "products", "users", "full"} <= set(registry.dataset_names())
+
+
+def test_get_dataset_converts_once():
+    first = registry.get_dataset("orders")
+    assert isinstance(first["orders"], pa.Table)
+    assert first["orders"].num_rows == 10
+    assert registry.get_dataset("orders")["orders"] is first["orders"]
+
+
+def test_get_dataset_is_read_only():
+    with pytest.raises(TypeError):
+        registry.get_dataset("orders")["orders"] = None
+
+
+def test_get_dataset_unknown_name():
+    with pytest.raises(KeyError, match="Unknown dataset"):
+        registry.get_dataset("nope")
+
+
+def test_register_dataset_name_conflict(sales_dataset):
+    registry.register_dataset("sales", sales_dataset)
+    with pytest.raises(ValueError, match="already registered"):
+        registry.register_dataset("sales", {"sales": []})
+
+
+def test_seeder_from_dataset(sales_dataset):
+    executor = DuckdbSQLExecutor(
+        dialect=Dialect.DUCKDB, seeder=DuckdbSQLSeeder.from_dataset("sales")
+    )
+    df = executor.query_to_df("SELECT COUNT(*) AS n, SUM(amount) AS s FROM sales")
+    assert df.iloc[0]["n"] == 2
+    assert df.iloc[0]["s"] == pytest.approx(10.0)
+
+
+def test_registered_dict_uses_cache(monkeypatch):
+    registry.get_dataset("full")
+
+    def _fail(_):
+        raise AssertionError("dataset converted twice")
+
+    monkeypatch.setattr(registry, "_to_arrow", _fail)
+    seeder = DuckdbSQLSeeder(fixtures.FULL)
+    assert seeder.get_connection().execute("SELECT COUNT(*) FROM users").fetchone() == (
+        6,
+    )
+
+
+def test_cached_seed_matches_pandas_types():
+    cached = DuckdbSQLSeeder.from_dataset("full").catalog()
+    direct = DuckdbSQLSeeder({k: list(v) for k, v in fixtures.FULL.items()}).catalog()
+    assert cached == direct
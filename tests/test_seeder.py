@@ -1,7 +1,11 @@
 import json
+import os
 
+import duckdb
+import pandas as pd
 import pytest
 
+from duckdb_simulator import fixtures
 from duckdb_simulator.seeder import DuckdbSQLSeeder
 
 
@@ -79,3 +83,242 @@ def test_seeder_multiple_tables_no_conflict():
     for i in range(1, 4):
         df = conn.execute(f"SELECT * FROM table{i}").fetchdf()
         assert df["id"].iloc[0] == i
+
+
+@pytest.fixture
+def events_seeder():
+    return DuckdbSQLSeeder(
+        {
+            "events": [
+                {"day": 1, "name": "a", "value": 10},
+                {"day": 2, "name": "b", "value": 20},
+            ]
+        }
+    )
+
+
+def _rows(seeder, sql):
+    return seeder.get_connection().execute(sql).fetchall()
+
+
+def test_seeder_resource_settings(tmp_path):
+    seeder = DuckdbSQLSeeder(
+        {"t": [{"id": 1}]},
+        threads=2,
+        memory_limit="512MB",
+        temp_directory=str(tmp_path),
+        preserve_insertion_order=False,
+    )
+    conn = seeder.get_connection()
+    threads, temp_dir, keep_order = conn.execute(
+        "SELECT current_setting('threads'), current_setting('temp_directory'), "
+        "current_setting('preserve_insertion_order')"
+    ).fetchone()
+    assert threads == 2
+    assert temp_dir == str(tmp_path)
+    assert keep_order is False
+
+
+def test_seeder_invalid_threads():
+    with pytest.raises(ValueError, match="threads"):
+        DuckdbSQLSeeder({"t": [{"id": 1}]}, threads=0)
+
+
+def test_seeder_parallel_matches_sequential():
+    data = {
+        f"t{i}": [{"id": n, "label": f"row{n}"} for n in range(100)] for i in range(6)
+    }
+    parallel = DuckdbSQLSeeder(data, seed_workers=4)
+    sequential = DuckdbSQLSeeder(data, seed_workers=1)
+    for table in data:
+        sql = f"SELECT * FROM {table} ORDER BY id"
+        assert _rows(parallel, sql) == _rows(sequential, sql)
+    assert set(parallel.seed_timings) == set(data)
+    assert all(seconds >= 0 for seconds in parallel.seed_timings.values())
+
+
+def test_seeder_default_workers_respect_threads(monkeypatch):
+    monkeypatch.setattr(os, "cpu_count", lambda: 64)
+    capped = DuckdbSQLSeeder(threads=2)
+    assert capped._default_seed_workers(20) == 2
+    assert capped._default_seed_workers(3) == 1
+    assert DuckdbSQLSeeder()._default_seed_workers(20) == 64
+
+
+def test_seeder_parallel_validates_before_loading():
+    with pytest.raises(ValueError, match="Invalid table name"):
+        DuckdbSQLSeeder({"good": [{"id": 1}], "bad name": [{"id": 2}]}, seed_workers=2)
+
+
+def test_seeder_parallel_directory(tmp_path):
+    for i in range(3):
+        (tmp_path / f"t{i}.csv").write_text(f"id,value\n{i},{i * 10}\n")
+    seeder = DuckdbSQLSeeder(str(tmp_path), seed_workers=3)
+    assert _rows(seeder, "SELECT value FROM t2") == [(20,)]
+    assert set(seeder.seed_timings) == {"t0", "t1", "t2"}
+
+
+def test_seeder_append(events_seeder):
+    events_seeder.append("events", [{"value": 30, "day": 3, "name": "c"}])
+    assert _rows(events_seeder, "SELECT day, value FROM events ORDER BY day") == [
+        (1, 10),
+        (2, 20),
+        (3, 30),
+    ]
+
+
+def test_seeder_append_dataframe(events_seeder):
+    events_seeder.append("events", pd.DataFrame({"day": [3, 4], "name": ["c", "d"]}))
+    assert _rows(events_seeder, "SELECT COUNT(*), COUNT(value) FROM events") == [(4, 2)]
+
+
+def test_seeder_upsert(events_seeder):
+    events_seeder.upsert(
+        "events",
+        [{"day": 2, "name": "b", "value": 99}, {"day": 3, "name": "c", "value": 30}],
+        key="day",
+    )
+    assert _rows(events_seeder, "SELECT day, value FROM events ORDER BY day") == [
+        (1, 10),
+        (2, 99),
+        (3, 30),
+    ]
+
+
+def test_seeder_upsert_rejects_duplicate_keys(events_seeder):
+    with pytest.raises(ValueError, match="several rows with key {'day': 2}"):
+        events_seeder.upsert(
+            "events",
+            [{"day": 2, "name": "x", "value": 1}, {"day": 2, "name": "y", "value": 2}],
+            key="day",
+        )
+    assert _rows(events_seeder, "SELECT day, value FROM events ORDER BY day") == [
+        (1, 10),
+        (2, 20),
+    ]
+
+
+def test_seeder_upsert_composite_key(events_seeder):
+    events_seeder.upsert(
+        "events", [{"day": 1, "name": "z", "value": 5}], key=["day", "name"]
+    )
+    assert _rows(events_seeder, "SELECT COUNT(*) FROM events WHERE day = 1") == [(2,)]
+
+
+def test_seeder_upsert_rolls_back_on_error(events_seeder):
+    with pytest.raises(duckdb.Error):
+        events_seeder.upsert("events", [{"day": 1, "missing": 1}], key="day")
+    assert _rows(events_seeder, "SELECT COUNT(*) FROM events") == [(2,)]
+
+
+def test_seeder_upsert_invalid_key(events_seeder):
+    with pytest.raises(ValueError, match="Invalid column name"):
+        events_seeder.upsert("events", [{"day": 1}], key="day; DROP TABLE events")
+
+
+def test_seeder_replace(events_seeder):
+    events_seeder.replace("events", [{"id": 1}])
+    assert _rows(events_seeder, "SELECT * FROM events") == [(1,)]
+
+
+def test_seeder_replace_invalid_table_name(events_seeder):
+    with pytest.raises(ValueError, match="Invalid table name"):
+        events_seeder.replace("events; DROP TABLE events", [{"id": 1}])
+
+
+def test_seeder_with_ndjson_file(tmp_path):
+    file_path = tmp_path / "events.ndjson"
+    file_path.write_text('{"id": 1, "kind": "click"}\n{"id": 2, "kind": "view"}\n')
+    seeder = DuckdbSQLSeeder(file_path)
+    assert _rows(seeder, "SELECT id, kind FROM events ORDER BY id") == [
+        (1, "click"),
+        (2, "view"),
+    ]
+
+
+def test_seeder_with_directory_manifest(tmp_path):
+    (tmp_path / "orders.csv").write_text("id,amount\n1,10.5\n2,20.0\n")
+    (tmp_path / "users.jsonl").write_text('{"id": 1}\n')
+    (tmp_path / "notes.txt").write_text("ignored")
+    seeder = DuckdbSQLSeeder(str(tmp_path))
+    seeder.get_connection().execute(
+        f"COPY orders TO '{tmp_path / 'copy.parquet'}' (FORMAT parquet)"
+    )
+    assert _rows(seeder, "SELECT SUM(amount) FROM orders") == [(30.5,)]
+    assert _rows(seeder, "SELECT COUNT(*) FROM users") == [(1,)]
+
+    reseeded = DuckdbSQLSeeder(tmp_path / "copy.parquet")
+    assert _rows(reseeded, "SELECT COUNT(*) FROM copy") == [(2,)]
+
+
+def test_seeder_json_manifest_matches_pandas_types(tmp_path):
+    data = {
+        **fixtures.FULL,
+        "events": [
+            {"id": 1, "order_date": "2024-01-05", "created": "2024-01-05T10:00:00"},
+            {"id": 2, "order_date": "2024-02-05", "created": None, "score": 3},
+            {
+                "id": 3,
+                "order_date": None,
+                "created": "2024-01-07T11:00:00",
+                "score": None,
+            },
+        ],
+    }
+    path = tmp_path / "manifest.json"
+    path.write_text(json.dumps(data))
+    from_file = DuckdbSQLSeeder(str(path))
+    assert from_file.catalog() == DuckdbSQLSeeder(data).catalog()
+    assert from_file.catalog()["events"]["order_date"] == "VARCHAR"
+    assert from_file.catalog()["events"]["score"] == "DOUBLE"
+    assert _rows(
+        from_file, "SELECT created FROM events WHERE order_date LIKE '2024-01%'"
+    ) == [("2024-01-05T10:00:00",)]
+
+
+def test_seeder_json_manifest_keeps_large_integers(tmp_path):
+    data = {
+        "unsigned": [{"big": 18446744073709551000}, {"big": 9223372036854775900}],
+        "unsigned_nulls": [{"big": 18446744073709551000}, {"big": None}],
+        "mixed": [{"big": -1}, {"big": 18446744073709551000}],
+        "small": [{"n": 1}, {"n": -1}],
+    }
+    path = tmp_path / "manifest.json"
+    path.write_text(json.dumps(data))
+    from_file = DuckdbSQLSeeder(str(path))
+    assert from_file.catalog() == DuckdbSQLSeeder(data).catalog()
+    assert from_file.catalog()["unsigned"]["big"] == "UBIGINT"
+    assert from_file.catalog()["mixed"]["big"] == "HUGEINT"
+    assert from_file.catalog()["small"]["n"] == "BIGINT"
+    assert _rows(from_file, "SELECT big FROM unsigned") == [
+        (18446744073709551000,),
+        (9223372036854775900,),
+    ]
+    assert _rows(from_file, "SELECT big FROM mixed") == [
+        (-1,),
+        (18446744073709551000,),
+    ]
+
+
+def test_seeder_lazy_files_are_views(tmp_path):
+    file_path = tmp_path / "orders.csv"
+    file_path.write_text("id\n1\n")
+    seeder = DuckdbSQLSeeder(file_path, lazy=True)
+    assert _rows(
+        seeder,
+        "SELECT table_type FROM information_schema.tables WHERE table_name = 'orders'",
+    ) == [("VIEW",)]
+    file_path.write_text("id\n1\n2\n")
+    assert _rows(seeder, "SELECT COUNT(*) FROM orders") == [(2,)]
+
+
+def test_seeder_json_manifest_rejects_non_list(tmp_path):
+    file_path = tmp_path / "mock.json"
+    file_path.write_text(json.dumps({"settings": {"a": 1}}))
+    with pytest.raises(ValueError, match="list of objects"):
+        DuckdbSQLSeeder(str(file_path))
+
+
+def test_seeder_empty_directory(tmp_path):
+    with pytest.raises(ValueError, match="No supported data files"):
+        DuckdbSQLSeeder(tmp_path)
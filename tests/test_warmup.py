@@ -0,0 +1,72 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from duckdb_simulator import fixtures
+from duckdb_simulator.executor import DuckdbSQLExecutor
+from duckdb_simulator.models import Dialect
+from duckdb_simulator.seeder import DuckdbSQLSeeder
+from duckdb_simulator.warmup import start_warmup
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+
+
+def test_executor_warmup_reports_latency():
+    executor = DuckdbSQLExecutor(
+        dialect=Dialect.AZURE_SYNAPSE,
+        seeder=DuckdbSQLSeeder(fixtures.ORDERS),
+        warmup=True,
+    )
+    df = executor.query_to_df("SELECT TOP 1 id FROM orders ORDER BY id")
+    assert df.iloc[0]["id"] == 1
+
+    report = executor.warmup.wait(timeout=30)
+    assert executor.warmup.done
+    assert report.dialect == "tsql"
+    assert report.cold_seconds > 0
+    assert report.warm_seconds > 0
+
+
+def test_executor_warmup_disabled_by_default():
+    executor = DuckdbSQLExecutor(
+        dialect=Dialect.DUCKDB, seeder=DuckdbSQLSeeder(fixtures.ORDERS)
+    )
+    assert executor.warmup is None
+
+
+def test_warmup_without_connection():
+    report = start_warmup("snowflake").wait(timeout=30)
+    assert report.dialect == "snowflake"
+
+
+def test_warmup_unknown_dialect_raises_on_wait():
+    warmup = start_warmup("not-a-dialect")
+    with pytest.raises(Exception, match="not-a-dialect"):
+        warmup.wait(timeout=30)
+
+
+def test_pytest_plugin_warmup(tmp_path):
+    (tmp_path / "conftest.py").write_text(
+        'pytest_plugins = ["duckdb_simulator.pytest_plugin"]\n'
+    )
+    (tmp_path / "test_sample.py").write_text("def test_nothing():\n    pass\n")
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "pytest",
+            "-p",
+            "no:cacheprovider",
+            "--duckdb-warmup=tsql, azure-synapse-t-sql",
+        ],
+        cwd=tmp_path,
+        env={**os.environ, "PYTHONPATH": str(SRC)},
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert "duckdb-simulator warm-up" in result.stdout
+    assert result.stdout.count("tsql: cold") == 2